@@ -2,9 +2,14 @@
 
 from .drcov import (
     read,
+    read_arrays,
+    read_modules,
+    read_summary,
     write,
     builder,
     CoverageData,
+    CoverageArrays,
+    CoverageSummary,
     BasicBlock,
     ModuleEntry,
     FileHeader,
@@ -16,9 +21,14 @@ from .core import CoverageSet
 
 __all__ = [
     "read",
+    "read_arrays",
+    "read_modules",
+    "read_summary",
     "write",
     "builder",
     "CoverageData",
+    "CoverageArrays",
+    "CoverageSummary",
     "BasicBlock",
     "ModuleEntry",
     "FileHeader",
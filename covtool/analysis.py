@@ -122,10 +122,9 @@ def _generate_coverage_data(
             }
 
         # address space analysis
-        addresses = coverage.get_absolute_addresses()
-        if addresses:
-            min_addr = min(addresses)
-            max_addr = max(addresses)
+        address_range = coverage.get_address_range()
+        if address_range:
+            min_addr, max_addr = address_range
             addr_range = max_addr - min_addr
 
             data["address_space"] = {
@@ -145,6 +144,7 @@ def _generate_coverage_data(
 
     # module information
     by_module = coverage.get_coverage_by_module()
+    block_indices = None  # block -> first index, built on first use
     if by_module:
         sorted_modules = sorted(
             by_module.items(), key=lambda x: len(x[1]), reverse=True
@@ -186,11 +186,19 @@ def _generate_coverage_data(
             # top k blocks by hits for specific module filter only
             if module_filter and module_filter.lower() in module_name.lower():
                 # Sort by hits, then by size for tie-breaking
-                blocks_with_hits = []
-                for block in blocks:
-                    block_index = coverage.data.basic_blocks.index(block)
-                    hits = coverage.data.get_hit_count(block_index)
-                    blocks_with_hits.append((block, hits))
+                # map blocks to their first index once instead of a
+                # list.index() scan per block
+                if block_indices is None:
+                    block_indices = {
+                        block: i
+                        for i, block in reversed(
+                            list(enumerate(coverage.data.basic_blocks))
+                        )
+                    }
+                blocks_with_hits = [
+                    (block, coverage.data.get_hit_count(block_indices[block]))
+                    for block in blocks
+                ]
 
                 top_blocks_by_hits = sorted(
                     blocks_with_hits, key=lambda x: (-x[1], -x[0].size)
@@ -1,8 +1,10 @@
 """high-level abstraction for coverage data analysis and manipulation"""
 
 import os
-from typing import Dict, Set, List, Optional
+from array import array
+from typing import Dict, Set, List, Optional, Tuple
 from collections import defaultdict, Counter
+from itertools import compress
 from dataclasses import dataclass
 
 from .drcov import CoverageData, BasicBlock, ModuleEntry
@@ -18,6 +20,8 @@ class CoverageSet:
         self.data = coverage_data
         self._module_map = {m.id: m for m in coverage_data.modules}
         self._blocks_set = set(coverage_data.basic_blocks)
+        self._module_stats = None  # built on first get_module_stats() call
+        self._address_range = None  # built on first get_address_range() call
 
     @classmethod
     def from_file(cls, filepath: str, permissive: bool = False) -> "CoverageSet":
@@ -73,12 +77,34 @@ class CoverageSet:
 
     def get_absolute_addresses(self) -> Set[int]:
         """convert all blocks to absolute memory addresses"""
-        addresses = set()
-        for block in self.data.basic_blocks:
-            module = self.data.find_module(block.module_id)
-            if module:
-                addresses.add(module.base + block.start)
-        return addresses
+        return set(self.get_absolute_address_array())
+
+    def get_absolute_address_array(self) -> array:
+        """
+        absolute memory address of every block (duplicates kept) as a compact
+        uint64 array, for min/max style scans without a set of python ints
+        """
+        bases = {
+            module_id: m.base for module_id, m in self.data.modules_by_id().items()
+        }
+        return array(
+            "Q",
+            [
+                bases[block.module_id] + block.start
+                for block in self.data.basic_blocks
+                if block.module_id in bases
+            ],
+        )
+
+    def get_address_range(self) -> Optional[Tuple[int, int]]:
+        """
+        lowest and highest absolute block address, or None without blocks;
+        computed once per coverage set
+        """
+        if self._address_range is None:
+            addresses = self.get_absolute_address_array()
+            self._address_range = (min(addresses), max(addresses)) if addresses else ()
+        return self._address_range or None
 
     def filter_by_module(self, module_filter: str) -> "CoverageSet":
         """return coverage filtered to modules matching the given string"""
@@ -102,15 +128,13 @@ class CoverageSet:
 
         matching_ids = {m.id for m in matching_modules}
 
-        # Filter blocks and preserve corresponding hit counts
-        filtered_blocks = []
+        # Filter blocks and preserve corresponding hit counts, selecting both
+        # columns with one membership mask
+        keep = [block.module_id in matching_ids for block in self.data.basic_blocks]
+        filtered_blocks = list(compress(self.data.basic_blocks, keep))
         filtered_hit_counts = []
-
-        for i, block in enumerate(self.data.basic_blocks):
-            if block.module_id in matching_ids:
-                filtered_blocks.append(block)
-                if self.data.has_hit_counts():
-                    filtered_hit_counts.append(self.data.hit_counts[i])
+        if self.data.has_hit_counts():
+            filtered_hit_counts = list(compress(self.data.hit_counts, keep))
 
         # create new coverage data
         from .drcov import CoverageData, FileHeader, ModuleTableVersion
@@ -127,26 +151,67 @@ class CoverageSet:
 
     def get_coverage_by_module(self) -> Dict[str, List[BasicBlock]]:
         """organize coverage by module name"""
+        # resolve each module id to its name once instead of per block
+        names = {
+            module_id: os.path.basename(m.path)
+            for module_id, m in self.data.modules_by_id().items()
+        }
         by_module = defaultdict(list)
         for block in self.data.basic_blocks:
-            module = self.data.find_module(block.module_id)
-            if module:
-                module_name = os.path.basename(module.path)
+            module_name = names.get(block.module_id)
+            if module_name is not None:
                 by_module[module_name].append(block)
         return dict(by_module)
 
     def get_coverage_by_module_with_base(self) -> Dict[str, List[BasicBlock]]:
         """organize coverage by module name with base address to distinguish duplicates"""
+        # Include base address in key to distinguish duplicate modules
+        keys = {
+            module_id: f"{os.path.basename(m.path)}@0x{m.base:x}"
+            for module_id, m in self.data.modules_by_id().items()
+        }
         by_module = defaultdict(list)
         for block in self.data.basic_blocks:
-            module = self.data.find_module(block.module_id)
-            if module:
-                module_name = os.path.basename(module.path)
-                # Include base address in key to distinguish duplicate modules
-                key = f"{module_name}@0x{module.base:x}"
+            key = keys.get(block.module_id)
+            if key is not None:
                 by_module[key].append(block)
         return dict(by_module)
 
+    def get_module_stats(self) -> Dict[str, Tuple[int, int, int]]:
+        """
+        per-module (block count, covered bytes, total hits) keyed like
+        get_coverage_by_module_with_base; computed once per coverage set
+        """
+        if self._module_stats is not None:
+            return self._module_stats
+
+        # aggregate per module id in single passes over the blocks, then fold
+        # the ids into name@base keys
+        summary = self.data.summarize()
+        if self.data.has_hit_counts():
+            hits_by_module = defaultdict(int)
+            for block, hits in zip(self.data.basic_blocks, self.data.hit_counts):
+                hits_by_module[block.module_id] += hits
+        else:
+            # default hit count of 1 for each block
+            hits_by_module = summary.blocks_by_module
+
+        stats = {}
+        for module_id, block_count in summary.blocks_by_module.items():
+            module = self.data.find_module(module_id)
+            if not module:
+                continue
+            key = f"{os.path.basename(module.path)}@0x{module.base:x}"
+            count, size, hits = stats.get(key, (0, 0, 0))
+            stats[key] = (
+                count + block_count,
+                size + summary.bytes_by_module[module_id],
+                hits + hits_by_module[module_id],
+            )
+
+        self._module_stats = stats
+        return stats
+
     def get_rarity_info(self, all_sets: List["CoverageSet"]) -> Dict[BasicBlock, int]:
         """
         for each block, count how many coverage sets contain it
@@ -36,13 +36,26 @@ Example Usage:
     drcov.write(new_coverage, "output.drcov")
 """
 
-import argparse
+import array
+import contextlib
 import dataclasses
+import functools
+import gc
+import gzip
 import io
+import itertools
+import mmap
+import os
+import stat
 import struct
 import sys
+from collections import Counter
 from enum import Enum
-from typing import BinaryIO, Dict, List, Optional, TextIO, Tuple, Type, TypeVar, Union
+from operator import attrgetter
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Type, TypeVar, Union
+
+if TYPE_CHECKING:
+    import argparse
 
 # --- Constants ---
 _SUPPORTED_FILE_VERSION = 2
@@ -55,6 +68,25 @@ _BB_TABLE_PREFIX = "BB Table: "
 _HIT_COUNT_TABLE_PREFIX = "Hit Count Table: "
 _COLUMNS_PREFIX = "Columns: "
 
+# How far past the BB table to look for the optional hit count table header
+_HIT_COUNT_HEADER_SCAN_LIMIT = 256
+
+# Start of the BB table header line, which ends the text region of a file
+_BB_TABLE_MARKER = _BB_TABLE_PREFIX.rstrip().encode("utf-8")
+
+# Chunk size for reading only the text region of a file
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Paths with this suffix are transparently gzip-compressed on read and write
+_GZIP_SUFFIX = ".gz"
+
+# Pre-compiled record layout for BB table entries: start, size, module_id
+_BB_STRUCT = struct.Struct("<IHH")
+
+# array typecodes for uint32 / uint16 columns
+_U32_TYPECODE = "I" if array.array("I").itemsize == 4 else "L"
+_U16_TYPECODE = "H"
+
 # Flavor constants
 _FLAVOR_STANDARD = "drcov"
 _FLAVOR_WITH_HITS = "drcov-hits"
@@ -77,7 +109,7 @@ class ModuleTableVersion(Enum):
     V4 = 4
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FileHeader:
     """DrCov file header containing version and tool information."""
 
@@ -93,7 +125,7 @@ class FileHeader:
         return self.flavor == _FLAVOR_WITH_HITS
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModuleEntry:
     """Represents a loaded module/library in the traced process."""
 
@@ -117,7 +149,7 @@ class ModuleEntry:
         return self.base <= addr < self.end
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class BasicBlock:
     """Represents an executed basic block."""
 
@@ -142,13 +174,51 @@ class CoverageData:
     module_version: ModuleTableVersion
     hit_counts: Optional[List[int]] = None  # Parallel array to basic_blocks
 
+    # Lazily built ID -> table position index for tables with non-sequential IDs
+    _module_index: Dict[int, int] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _module_index_source: Optional[List[ModuleEntry]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _module_index_size: int = dataclasses.field(
+        default=-1, init=False, repr=False, compare=False
+    )
+
     def find_module(self, module_id: int) -> Optional[ModuleEntry]:
         """Finds a module by its ID."""
+        modules = self.modules
         # Fast path for sequential IDs
-        if module_id < len(self.modules) and self.modules[module_id].id == module_id:
-            return self.modules[module_id]
-        # Slow path for non-sequential or gapped IDs
-        return next((m for m in self.modules if m.id == module_id), None)
+        if module_id < len(modules) and modules[module_id].id == module_id:
+            return modules[module_id]
+        # Slow path for non-sequential or gapped IDs: an ID -> position index.
+        # It is only trusted for the same list at the same length, and the
+        # entry at the recorded position must still carry the ID; otherwise
+        # (modules added, removed or renumbered) it is rebuilt.
+        index_valid = (
+            self._module_index_source is modules
+            and self._module_index_size == len(modules)
+        )
+        if index_valid:
+            position = self._module_index.get(module_id)
+            if position is not None and modules[position].id == module_id:
+                return modules[position]
+
+        # First entry wins for duplicate IDs, matching a linear scan
+        self._module_index = {
+            modules[i].id: i for i in range(len(modules) - 1, -1, -1)
+        }
+        self._module_index_source = modules
+        self._module_index_size = len(modules)
+        position = self._module_index.get(module_id)
+        return modules[position] if position is not None else None
+
+    def modules_by_id(self) -> Dict[int, ModuleEntry]:
+        """
+        Maps each module ID to its module entry, for resolving many blocks at
+        once. Duplicate IDs resolve like find_module: the first entry wins.
+        """
+        return {m.id: m for m in reversed(self.modules)}
 
     def find_module_by_address(self, addr: int) -> Optional[ModuleEntry]:
         """Finds the module that contains a given absolute address."""
@@ -156,11 +226,23 @@ class CoverageData:
 
     def get_coverage_stats(self) -> Dict[int, int]:
         """Calculates the number of basic blocks executed per module."""
-        stats: Dict[int, int] = {m.id: 0 for m in self.modules}
+        # Counter tallies the module ID column in C, one pass over the blocks
+        counts = Counter(map(attrgetter("module_id"), self.basic_blocks))
+        return {m.id: counts[m.id] for m in self.modules}
+
+    def summarize(self) -> "CoverageSummary":
+        """Calculates the number of basic blocks and bytes covered per module."""
+        blocks_by_module = dict(Counter(map(attrgetter("module_id"), self.basic_blocks)))
+        bytes_by_module: Dict[int, int] = {}
         for bb in self.basic_blocks:
-            if bb.module_id in stats:
-                stats[bb.module_id] += 1
-        return stats
+            bytes_by_module[bb.module_id] = bytes_by_module.get(bb.module_id, 0) + bb.size
+        return CoverageSummary(
+            self.header,
+            self.modules,
+            self.module_version,
+            blocks_by_module,
+            bytes_by_module,
+        )
 
     def validate(self, permissive: bool = False) -> None:
         """
@@ -183,25 +265,31 @@ class CoverageData:
                 if permissive:
                     print(f"Warning: Non-sequential module ID {module.id} at index {i}")
 
+        # Check block module IDs against the module table as a set difference,
+        # so the common all-valid case is a single C-level pass over the blocks
+        invalid_ids = set(map(attrgetter("module_id"), self.basic_blocks)) - module_ids
+        if invalid_ids and not permissive:
+            first_invalid = next(
+                bb.module_id for bb in self.basic_blocks if bb.module_id in invalid_ids
+            )
+            raise DrCovError(
+                f"Basic block references invalid module ID: {first_invalid}"
+            )
+
         # Filter out invalid basic blocks in permissive mode
-        invalid_blocks = []
-        for bb in self.basic_blocks:
-            if bb.module_id not in module_ids:
-                if permissive:
-                    invalid_blocks.append(bb)
-                else:
-                    raise DrCovError(
-                        f"Basic block references invalid module ID: {bb.module_id}"
-                    )
-        
-        if permissive and invalid_blocks:
-            print(f"Warning: Filtering out {len(invalid_blocks)} basic blocks with invalid module IDs")
-            valid_indices = [
-                i for i, bb in enumerate(self.basic_blocks) if bb.module_id in module_ids
-            ]
-            self.basic_blocks = [self.basic_blocks[i] for i in valid_indices]
+        if invalid_ids:
+            # Build the keep-mask and its count in C, without a Python-level loop
+            valid_mask = list(
+                map(
+                    module_ids.__contains__,
+                    map(attrgetter("module_id"), self.basic_blocks),
+                )
+            )
+            invalid_count = valid_mask.count(False)
+            print(f"Warning: Filtering out {invalid_count} basic blocks with invalid module IDs")
+            self.basic_blocks = list(itertools.compress(self.basic_blocks, valid_mask))
             if self.hit_counts:
-                self.hit_counts = [self.hit_counts[i] for i in valid_indices]
+                self.hit_counts = list(itertools.compress(self.hit_counts, valid_mask))
 
         # Validate hit counts if present
         if self.hit_counts is not None:
@@ -215,7 +303,7 @@ class CoverageData:
                         self.hit_counts = self.hit_counts[: len(self.basic_blocks)]
                     else:
                         missing = len(self.basic_blocks) - len(self.hit_counts)
-                        self.hit_counts.extend([1] * missing)
+                        self.hit_counts.extend(itertools.repeat(1, missing))
                 else:
                     raise DrCovError(
                         f"Hit count array length ({len(self.hit_counts)}) "
@@ -239,6 +327,38 @@ class CoverageData:
         return [(block, 1) for block in self.basic_blocks]
 
 
+@dataclasses.dataclass(slots=True)
+class CoverageSummary:
+    """Per-module coverage totals, computed without materializing basic blocks."""
+
+    header: FileHeader
+    modules: List[ModuleEntry]
+    module_version: ModuleTableVersion
+    blocks_by_module: Dict[int, int]  # Module ID -> covered basic blocks
+    bytes_by_module: Dict[int, int]  # Module ID -> covered bytes
+
+    @property
+    def total_blocks(self) -> int:
+        return sum(self.blocks_by_module.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes_by_module.values())
+
+
+@dataclasses.dataclass(slots=True)
+class CoverageArrays:
+    """Coverage data with the basic blocks held as parallel typed columns."""
+
+    header: FileHeader
+    modules: List[ModuleEntry]
+    module_version: ModuleTableVersion
+    starts: array.array  # uint32 module-relative offsets
+    sizes: array.array  # uint16 block sizes
+    module_ids: array.array  # uint16 module IDs
+    hit_counts: Optional[array.array] = None  # uint32, parallel to the columns
+
+
 class CoverageBuilder:
     """Builder pattern for fluently creating CoverageData objects."""
 
@@ -330,56 +450,106 @@ class CoverageBuilder:
 # --- Parser Implementation ---
 
 
+# Positional row builders for the module table column layouts that drcov
+# producers actually emit (int() tolerates the whitespace around each value).
+# Paths are interned: the same few paths recur across every trace of a target.
+
+
+def _module_row_v2(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[1], 16), int(v[2], 16), sys.intern(v[4].strip()), int(v[3], 16)
+    )
+
+
+def _module_row_v2_windows(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[1], 16), int(v[2], 16), sys.intern(v[6].strip()), int(v[3], 16),
+        checksum=int(v[4], 16), timestamp=int(v[5], 16),
+    )
+
+
+def _module_row_v3(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[2], 16), int(v[3], 16), sys.intern(v[5].strip()), int(v[4], 16),
+        containing_id=int(v[1]),
+    )
+
+
+def _module_row_v3_windows(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[2], 16), int(v[3], 16), sys.intern(v[7].strip()), int(v[4], 16),
+        containing_id=int(v[1]), checksum=int(v[5], 16), timestamp=int(v[6], 16),
+    )
+
+
+def _module_row_v4(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[2], 16), int(v[3], 16), sys.intern(v[6].strip()), int(v[4], 16),
+        containing_id=int(v[1]), offset=int(v[5], 16),
+    )
+
+
+def _module_row_v4_windows(v: List[str]) -> ModuleEntry:
+    return ModuleEntry(
+        int(v[0]), int(v[2], 16), int(v[3], 16), sys.intern(v[8].strip()), int(v[4], 16),
+        containing_id=int(v[1]), offset=int(v[5], 16),
+        checksum=int(v[6], 16), timestamp=int(v[7], 16),
+    )
+
+
+_MODULE_ROW_BUILDERS: Dict[Tuple[str, ...], Callable[[List[str]], ModuleEntry]] = {
+    ("id", "base", "end", "entry", "path"): _module_row_v2,
+    ("id", "base", "end", "entry", "checksum", "timestamp", "path"): _module_row_v2_windows,
+    ("id", "containing_id", "start", "end", "entry", "path"): _module_row_v3,
+    (
+        "id", "containing_id", "start", "end", "entry", "checksum", "timestamp", "path",
+    ): _module_row_v3_windows,
+    ("id", "containing_id", "start", "end", "entry", "offset", "path"): _module_row_v4,
+    (
+        "id", "containing_id", "start", "end", "entry", "offset", "checksum",
+        "timestamp", "path",
+    ): _module_row_v4_windows,
+}
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Suspends the cyclic GC while bulk-allocating millions of acyclic objects."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 class _Parser:
     @staticmethod
-    def parse_stream(stream: TextIO, permissive: bool = False) -> CoverageData:
-        header = _Parser._parse_header(stream)
-        if header.version != _SUPPORTED_FILE_VERSION:
-            raise DrCovError(
-                f"Unsupported DrCov version: {header.version}. Only version 2 is supported."
-            )
+    def _parse_bb_table(buffer, count: int, offset: int = 0) -> List[BasicBlock]:
+        """Decode `count` packed BB entries starting at `offset` in any buffer."""
+        end = offset + count * _BB_ENTRY_SIZE
+        if len(buffer) < end:
+            raise DrCovError("Failed to read complete BB table binary data.")
+
+        # Unpack straight out of the buffer (bytes or mmap) rather than
+        # slicing a fresh 8-byte object per entry
+        # Object construction dominates here, and GC passes triggered by the
+        # allocations would only rescan the growing list
+        with memoryview(buffer) as view, view[offset:end] as table, _gc_paused():
+            return list(itertools.starmap(BasicBlock, _BB_STRUCT.iter_unpack(table)))
 
-        modules, module_version = _Parser._parse_module_table(stream)
-        
-        # Read the BB table header as text first
-        bb_line = stream.readline().strip()
-        if not bb_line.startswith(_BB_TABLE_PREFIX):
-            # No BB table or empty
-            basic_blocks = []
-        else:
-            try:
-                count_str = bb_line[len(_BB_TABLE_PREFIX):].split(' ')[0]
-                count = int(count_str)
-            except (ValueError, IndexError) as e:
-                raise DrCovError(f"Malformed BB table count: {e}")
-            
-            if count == 0:
-                basic_blocks = []
-            else:
-                # Now switch to binary mode for the binary data
-                binary_stream = stream.buffer
-                binary_data = binary_stream.read(count * _BB_ENTRY_SIZE)
-                if len(binary_data) != count * _BB_ENTRY_SIZE:
-                    raise DrCovError("Failed to read complete BB table binary data.")
-                
-                basic_blocks = []
-                for i in range(count):
-                    offset = i * _BB_ENTRY_SIZE
-                    entry_data = binary_data[offset : offset + _BB_ENTRY_SIZE]
-                    start, size, mod_id = struct.unpack("<IHH", entry_data)
-                    basic_blocks.append(BasicBlock(start, size, mod_id))
-
-        # Try to read hit count table if present
-        hit_counts = None
-        try:
-            hit_counts = _Parser._parse_hit_count_table(stream, len(basic_blocks))
-        except (DrCovError, EOFError):
-            # No hit count table found, which is fine for backward compatibility
-            pass
+    @staticmethod
+    def _parse_hit_counts(binary_data, count: int) -> array.array:
+        """Decode `count` little-endian uint32 hit counts in a single C-level pass."""
+        if len(binary_data) != count * _HIT_COUNT_ENTRY_SIZE:
+            raise DrCovError("Failed to read complete hit count table binary data")
 
-        data = CoverageData(header, modules, basic_blocks, module_version, hit_counts)
-        data.validate(permissive=permissive)
-        return data
+        hit_counts = array.array(_U32_TYPECODE)
+        hit_counts.frombytes(binary_data)
+        if sys.byteorder != "little":
+            hit_counts.byteswap()
+        return hit_counts
 
     @staticmethod
     def _parse_header(stream: TextIO) -> FileHeader:
@@ -392,7 +562,7 @@ class _Parser:
             flavor_line = stream.readline()
             if not flavor_line.startswith(_FLAVOR_PREFIX):
                 raise DrCovError("Invalid or missing flavor header.")
-            flavor = flavor_line[len(_FLAVOR_PREFIX) :].strip()
+            flavor = sys.intern(flavor_line[len(_FLAVOR_PREFIX) :].strip())
 
             # Consume the blank line after the header (if present)
             pos = stream.tell()
@@ -430,6 +600,12 @@ class _Parser:
             count = int(content)
             columns = ["id", "base", "end", "entry", "path"]
 
+        # Pick a row builder once for the whole table: the known drcov dialects
+        # unpack positionally, anything else goes through the column map
+        build_entry = _MODULE_ROW_BUILDERS.get(tuple(columns))
+        if build_entry is None:
+            build_entry = functools.partial(_Parser._build_module_entry, columns)
+
         modules: List[ModuleEntry] = []
         for i in range(count):
             entry_line = stream.readline().strip()
@@ -438,38 +614,14 @@ class _Parser:
                     f"Module table entry count mismatch. Expected {count}, got {i}."
                 )
 
-            values = [
-                v.strip() for v in entry_line.split(",", maxsplit=len(columns) - 1)
-            ]
+            values = entry_line.split(",", maxsplit=len(columns) - 1)
             if len(values) != len(columns):
                 raise DrCovError(
                     f"Module entry column count mismatch on line: {entry_line}"
                 )
 
-            col_map = dict(zip(columns, values))
             try:
-                entry = ModuleEntry(
-                    id=int(col_map["id"]),
-                    base=int(col_map.get("base") or col_map.get("start", "0"), 16),
-                    end=int(col_map["end"], 16),
-                    path=col_map["path"],
-                    entry=int(col_map.get("entry", "0"), 16),
-                    containing_id=(
-                        int(col_map["containing_id"])
-                        if "containing_id" in col_map
-                        else None
-                    ),
-                    offset=int(col_map["offset"], 16) if "offset" in col_map else None,
-                    checksum=(
-                        int(col_map["checksum"], 16) if "checksum" in col_map else None
-                    ),
-                    timestamp=(
-                        int(col_map["timestamp"], 16)
-                        if "timestamp" in col_map
-                        else None
-                    ),
-                )
-                modules.append(entry)
+                modules.append(build_entry(values))
             except (ValueError, KeyError) as e:
                 raise DrCovError(f"Malformed module entry '{entry_line}': {e}")
 
@@ -479,101 +631,65 @@ class _Parser:
         return modules, version
 
     @staticmethod
-    def _parse_hit_count_table(stream: Union[TextIO, str], expected_count: int) -> List[int]:
-        """Parse hit count table. Returns list of hit counts or raises DrCovError if not found."""
-        try:
-            # Handle both TextIO streams and string content
-            if isinstance(stream, str):
-                lines = stream.split('\n')
-                if not lines or not lines[0].strip():
-                    raise DrCovError("No hit count table found")
-                hit_line = lines[0].strip()
-                remaining_content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
-            else:
-                hit_line = stream.readline().strip()
-                if not hit_line:
-                    raise DrCovError("No hit count table found")
-                remaining_content = stream.read()
-            
-            if not hit_line.startswith(_HIT_COUNT_TABLE_PREFIX):
-                raise DrCovError("Invalid hit count table header")
-            
-            # Parse header: "Hit Count Table: version 1, count <N>"
-            header_parts = hit_line[len(_HIT_COUNT_TABLE_PREFIX):].strip().split(',')
-            if len(header_parts) != 2:
-                raise DrCovError("Malformed hit count table header")
-            
-            version_part = header_parts[0].strip()
-            count_part = header_parts[1].strip()
-            
-            if not version_part.startswith("version "):
-                raise DrCovError("Missing version in hit count table header")
-            
-            version = int(version_part[8:])  # Skip "version "
-            if version != 1:
-                raise DrCovError(f"Unsupported hit count table version: {version}")
-            
-            if not count_part.startswith("count "):
-                raise DrCovError("Missing count in hit count table header")
-            
-            count = int(count_part[6:])  # Skip "count "
-            if count != expected_count:
-                raise DrCovError(
-                    f"Hit count table count ({count}) does not match basic block count ({expected_count})"
-                )
-            
-            if count == 0:
-                return []
-            
-            # Read binary hit count data - handle different stream types
-            if isinstance(stream, str) or not hasattr(stream, 'buffer'):
-                # For string content or StringIO, we need the binary data as bytes
-                binary_data = remaining_content.encode('latin1')[:count * _HIT_COUNT_ENTRY_SIZE]
-            else:
-                # For real file streams with buffer
-                binary_stream = stream.buffer
-                binary_data = binary_stream.read(count * _HIT_COUNT_ENTRY_SIZE)
-                
-            if len(binary_data) != count * _HIT_COUNT_ENTRY_SIZE:
-                raise DrCovError("Failed to read complete hit count table binary data")
-            
-            hit_counts = []
-            for i in range(count):
-                offset = i * _HIT_COUNT_ENTRY_SIZE
-                entry_data = binary_data[offset : offset + _HIT_COUNT_ENTRY_SIZE]
-                hit_count = struct.unpack("<I", entry_data)[0]
-                hit_counts.append(hit_count)
-            
-            return hit_counts
-        
-        except (ValueError, struct.error) as e:
-            raise DrCovError(f"Error parsing hit count table: {e}")
+    def _build_module_entry(columns: List[str], values: List[str]) -> ModuleEntry:
+        """Builds a module entry from an arbitrary column layout."""
+        col_map = dict(zip(columns, (v.strip() for v in values)))
+        return ModuleEntry(
+            id=int(col_map["id"]),
+            base=int(col_map.get("base") or col_map.get("start", "0"), 16),
+            end=int(col_map["end"], 16),
+            path=sys.intern(col_map["path"]),
+            entry=int(col_map.get("entry", "0"), 16),
+            containing_id=(
+                int(col_map["containing_id"])
+                if "containing_id" in col_map
+                else None
+            ),
+            offset=int(col_map["offset"], 16) if "offset" in col_map else None,
+            checksum=(
+                int(col_map["checksum"], 16) if "checksum" in col_map else None
+            ),
+            timestamp=(
+                int(col_map["timestamp"], 16)
+                if "timestamp" in col_map
+                else None
+            ),
+        )
 
     @staticmethod
-    def _parse_hit_count_table_from_binary(data: bytes, expected_count: int) -> List[int]:
-        """Parse hit count table from raw binary data with text header."""
+    def _parse_hit_count_table(
+        data, expected_count: int, offset: int = 0
+    ) -> array.array:
+        """Parse hit count table (text header + binary data) at `offset` in a buffer."""
         try:
-            text_part = data.decode("utf-8", errors="ignore")
-            lines = text_part.split("\n")
-
-            # Find the header line
-            header_line = None
-            header_end_pos = 0
-            for i, line in enumerate(lines):
-                if line.strip().startswith(_HIT_COUNT_TABLE_PREFIX):
-                    header_line = line.strip()
-                    header_end_pos = len("\n".join(lines[: i + 1]).encode("utf-8")) + 1
-                    break
-
-            if not header_line:
+            # The table directly follows the BB table, so only scan a bounded
+            # window for its header instead of decoding the whole tail as text
+            header_start = data.find(
+                _HIT_COUNT_TABLE_PREFIX.encode("utf-8"),
+                offset,
+                offset + _HIT_COUNT_HEADER_SCAN_LIMIT,
+            )
+            if header_start == -1:
                 raise DrCovError("Hit count table header not found")
 
+            header_end = data.find(b"\n", header_start)
+            if header_end == -1:
+                raise DrCovError("Malformed hit count table header")
+            header_line = data[header_start:header_end].decode("utf-8").strip()
+
             # Parse header: "Hit Count Table: version 1, count <N>"
             header_suffix = header_line[len(_HIT_COUNT_TABLE_PREFIX) :].strip()
             parts = header_suffix.split(",")
             if len(parts) != 2 or not parts[1].strip().startswith("count "):
                 raise DrCovError("Malformed hit count table header")
 
+            version_part = parts[0].strip()
+            if not version_part.startswith("version "):
+                raise DrCovError("Missing version in hit count table header")
+            version = int(version_part[8:])  # Skip "version "
+            if version != 1:
+                raise DrCovError(f"Unsupported hit count table version: {version}")
+
             count = int(parts[1].strip()[6:])  # Skip "count "
             if count != expected_count:
                 raise DrCovError(
@@ -582,132 +698,284 @@ class _Parser:
                 )
 
             if count == 0:
-                return []
+                return array.array(_U32_TYPECODE)
 
-            # Extract binary data
-            binary_start = header_end_pos
+            # Decode the counters straight out of the (possibly mapped) buffer
+            binary_start = header_end + 1
             binary_end = binary_start + count * _HIT_COUNT_ENTRY_SIZE
-            binary_data = data[binary_start:binary_end]
-
-            if len(binary_data) != count * _HIT_COUNT_ENTRY_SIZE:
-                raise DrCovError("Failed to read complete hit count table binary data")
-
-            hit_counts = []
-            for i in range(count):
-                offset = i * _HIT_COUNT_ENTRY_SIZE
-                entry_data = binary_data[offset : offset + _HIT_COUNT_ENTRY_SIZE]
-                hit_count = struct.unpack("<I", entry_data)[0]
-                hit_counts.append(hit_count)
-
-            return hit_counts
+            with memoryview(data) as view, view[binary_start:binary_end] as table:
+                return _Parser._parse_hit_counts(table, count)
 
         except (ValueError, struct.error, UnicodeDecodeError) as e:
-            raise DrCovError(f"Error parsing hit count table from binary: {e}")
+            raise DrCovError(f"Error parsing hit count table: {e}")
 
     @staticmethod
-    def parse_text_only(stream: TextIO, permissive: bool = False) -> CoverageData:
-        """Parse a drcov file that has no BB table."""
-        header = _Parser._parse_header(stream)
+    def _parse_text_region(
+        data, text_end: int
+    ) -> Tuple[FileHeader, List[ModuleEntry], ModuleTableVersion]:
+        """Decode and parse the header and module table held in `data[:text_end]`."""
+        text_stream = io.StringIO(data[:text_end].decode("utf-8", errors="ignore"))
+
+        header = _Parser._parse_header(text_stream)
         if header.version != _SUPPORTED_FILE_VERSION:
             raise DrCovError(
                 f"Unsupported DrCov version: {header.version}. Only version 2 is supported."
             )
+        modules, module_version = _Parser._parse_module_table(text_stream)
+        return header, modules, module_version
 
-        modules, module_version = _Parser._parse_module_table(stream)
-        basic_blocks = []  # No BB table
+    @staticmethod
+    def _parse_bb_table_header(data, bb_table_start: int) -> Tuple[int, int]:
+        """Returns the BB count and the offset of the packed entries that follow."""
+        line_end = data.find(b"\n", bb_table_start)
+        if line_end == -1:
+            line_end = len(data)
+        line = data[bb_table_start:line_end].decode("utf-8", errors="ignore").strip()
+        try:
+            count = int(line[len(_BB_TABLE_PREFIX):].split(' ')[0])
+        except (ValueError, IndexError) as e:
+            raise DrCovError(f"Malformed BB table count: {e}")
+        return count, line_end + 1
 
-        data = CoverageData(header, modules, basic_blocks, module_version, None)
-        data.validate(permissive=permissive)
-        return data
+    @staticmethod
+    def parse_prefix(
+        stream: BinaryIO,
+    ) -> Tuple[FileHeader, List[ModuleEntry], ModuleTableVersion, int]:
+        """Parse everything up to and including the BB table header line.
+
+        The stream is read in chunks only until that line is complete, so the
+        packed tables are never loaded. Returns the header, the modules, the
+        module table version and the BB count (0 if there is no BB table).
+        """
+        data = bytearray()
+        scan_from = 0
+        bb_table_start = -1
+        while True:
+            chunk = stream.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            data += chunk
+
+            if bb_table_start == -1:
+                bb_table_start = data.find(_BB_TABLE_MARKER, scan_from)
+                # The marker may straddle the next chunk boundary
+                scan_from = max(0, len(data) - len(_BB_TABLE_MARKER) + 1)
+            if bb_table_start != -1 and data.find(b"\n", bb_table_start) != -1:
+                break
+
+        header, modules, module_version = _Parser._parse_text_region(
+            data, len(data) if bb_table_start == -1 else bb_table_start
+        )
+        count = 0
+        if bb_table_start != -1:
+            count, _ = _Parser._parse_bb_table_header(data, bb_table_start)
+        return header, modules, module_version, count
 
     @staticmethod
-    def parse_with_binary(text_stream: TextIO, bb_stream: BinaryIO, permissive: bool = False) -> CoverageData:
-        """Parse a drcov file by splitting text and binary parts."""
-        header = _Parser._parse_header(text_stream)
-        if header.version != _SUPPORTED_FILE_VERSION:
-            raise DrCovError(
-                f"Unsupported DrCov version: {header.version}. Only version 2 is supported."
-            )
+    def parse_bytes(data, permissive: bool = False) -> CoverageData:
+        """Parse a complete drcov file held in any bytes-like buffer (bytes or mmap).
 
-        modules, module_version = _Parser._parse_module_table(text_stream)
-        
-        # Parse BB table from binary stream
-        line_bytes = bb_stream.readline()
-        if not line_bytes:
-            basic_blocks = []
-        else:
-            line = line_bytes.decode("utf-8", errors="ignore").strip()
-            if not line.startswith(_BB_TABLE_PREFIX):
-                raise DrCovError("Invalid or missing BB table header.")
+        Only the text region ahead of the BB table is decoded; the BB and hit
+        count tables are unpacked in place from the buffer.
+        """
+        bb_table_start = data.find(_BB_TABLE_MARKER)
+        header, modules, module_version = _Parser._parse_text_region(
+            data, len(data) if bb_table_start == -1 else bb_table_start
+        )
+
+        basic_blocks: List[BasicBlock] = []
+        hit_counts = None
+        if bb_table_start != -1:
+            count, bb_data_start = _Parser._parse_bb_table_header(data, bb_table_start)
+            basic_blocks = _Parser._parse_bb_table(data, count, bb_data_start)
 
+            # Try to read hit count table from the remaining data
             try:
-                count_str = line[len(_BB_TABLE_PREFIX):].split(' ')[0]
-                count = int(count_str)
-            except (ValueError, IndexError) as e:
-                raise DrCovError(f"Malformed BB table count: {e}")
+                hit_counts = _Parser._parse_hit_count_table(
+                    data, len(basic_blocks), bb_data_start + count * _BB_ENTRY_SIZE
+                ).tolist()
+            except DrCovError:
+                # No (or malformed) hit count table, fine for backward compatibility
+                pass
 
-            if count == 0:
-                basic_blocks = []
+        coverage = CoverageData(header, modules, basic_blocks, module_version, hit_counts)
+        coverage.validate(permissive=permissive)
+        return coverage
+
+    @staticmethod
+    def _parse_bb_columns(
+        buffer, count: int, offset: int = 0
+    ) -> Tuple[array.array, array.array, array.array]:
+        """Decode `count` packed BB entries at `offset` into (starts, sizes, module_ids)."""
+        end = offset + count * _BB_ENTRY_SIZE
+        if len(buffer) < end:
+            raise DrCovError("Failed to read complete BB table binary data.")
+
+        # Read the entries as uint32 and uint16 words so each field is a strided
+        # slice: start is dword 0, size and module ID are words 2 and 3
+        dwords = array.array(_U32_TYPECODE)
+        words = array.array(_U16_TYPECODE)
+        with memoryview(buffer) as view, view[offset:end] as table:
+            dwords.frombytes(table)
+            words.frombytes(table)
+        if sys.byteorder != "little":
+            dwords.byteswap()
+            words.byteswap()
+        return dwords[0::2], words[2::4], words[3::4]
+
+    @staticmethod
+    def _check_block_module_ids(
+        modules: List[ModuleEntry], module_ids: array.array, permissive: bool
+    ) -> set:
+        """Validate a module ID column as CoverageData.validate() would.
+
+        Returns the set of unknown IDs whose blocks must be dropped (only
+        possible in permissive mode).
+        """
+        known_ids = {m.id for m in modules}
+        if len(known_ids) != len(modules):
+            if permissive:
+                print("Warning: Duplicate module IDs found in module table.")
             else:
-                binary_data = bb_stream.read(count * _BB_ENTRY_SIZE)
-                if len(binary_data) != count * _BB_ENTRY_SIZE:
-                    raise DrCovError("Failed to read complete BB table binary data.")
-
-                basic_blocks = []
-                for i in range(count):
-                    offset = i * _BB_ENTRY_SIZE
-                    entry_data = binary_data[offset : offset + _BB_ENTRY_SIZE]
-                    start, size, mod_id = struct.unpack("<IHH", entry_data)
-                    basic_blocks.append(BasicBlock(start, size, mod_id))
-
-        # Try to read hit count table from the remaining binary stream
+                raise DrCovError("Duplicate module IDs found in module table.")
+
+        invalid_ids = set(module_ids) - known_ids
+        if invalid_ids and not permissive:
+            first_invalid = next(m for m in module_ids if m in invalid_ids)
+            raise DrCovError(f"Basic block references invalid module ID: {first_invalid}")
+        return invalid_ids
+
+    @staticmethod
+    def summarize_bytes(data, permissive: bool = False) -> CoverageSummary:
+        """Aggregate a complete drcov file per module without decoding BasicBlocks."""
+        bb_table_start = data.find(_BB_TABLE_MARKER)
+        header, modules, module_version = _Parser._parse_text_region(
+            data, len(data) if bb_table_start == -1 else bb_table_start
+        )
+
+        blocks_by_module: Dict[int, int] = {}
+        bytes_by_module: Dict[int, int] = {}
+        module_ids = array.array(_U16_TYPECODE)
+        if bb_table_start != -1:
+            count, offset = _Parser._parse_bb_table_header(data, bb_table_start)
+            _, sizes, module_ids = _Parser._parse_bb_columns(data, count, offset)
+
+            blocks_by_module = dict(Counter(module_ids))
+            for module_id, size in zip(module_ids, sizes):
+                bytes_by_module[module_id] = bytes_by_module.get(module_id, 0) + size
+
+        invalid_ids = _Parser._check_block_module_ids(modules, module_ids, permissive)
+        if invalid_ids:
+            invalid_count = 0
+            for module_id in invalid_ids:
+                invalid_count += blocks_by_module.pop(module_id)
+                del bytes_by_module[module_id]
+            print(f"Warning: Filtering out {invalid_count} basic blocks with invalid module IDs")
+
+        return CoverageSummary(
+            header, modules, module_version, blocks_by_module, bytes_by_module
+        )
+
+    @staticmethod
+    def parse_arrays(data, permissive: bool = False) -> CoverageArrays:
+        """Parse a complete drcov file into typed columns without decoding BasicBlocks."""
+        bb_table_start = data.find(_BB_TABLE_MARKER)
+        header, modules, module_version = _Parser._parse_text_region(
+            data, len(data) if bb_table_start == -1 else bb_table_start
+        )
+
+        starts = array.array(_U32_TYPECODE)
+        sizes = array.array(_U16_TYPECODE)
+        module_ids = array.array(_U16_TYPECODE)
         hit_counts = None
-        try:
-            # Check if there's more data in the binary stream
-            remaining_data = bb_stream.read()
-            if remaining_data:
-                # Look for hit count table header in the remaining data
-                try:
-                    text_part = remaining_data.decode("utf-8", errors="ignore")
-                    if _HIT_COUNT_TABLE_PREFIX in text_part:
-                        # Parse the hit count table from binary data
-                        hit_counts = _Parser._parse_hit_count_table_from_binary(
-                            remaining_data, len(basic_blocks)
-                        )
-                except UnicodeDecodeError:
-                    pass
-        except Exception:
-            # No hit count table found, which is fine for backward compatibility
-            pass
-
-        data = CoverageData(header, modules, basic_blocks, module_version, hit_counts)
-        data.validate(permissive=permissive)
-        return data
+        if bb_table_start != -1:
+            count, offset = _Parser._parse_bb_table_header(data, bb_table_start)
+            starts, sizes, module_ids = _Parser._parse_bb_columns(data, count, offset)
+            try:
+                hit_counts = _Parser._parse_hit_count_table(
+                    data, count, offset + count * _BB_ENTRY_SIZE
+                )
+            except DrCovError:
+                # No (or malformed) hit count table, fine for backward compatibility
+                pass
+
+        invalid_ids = _Parser._check_block_module_ids(modules, module_ids, permissive)
+        if invalid_ids:
+            keep = [module_id not in invalid_ids for module_id in module_ids]
+            print(f"Warning: Filtering out {keep.count(False)} basic blocks with invalid module IDs")
+            starts = array.array(starts.typecode, itertools.compress(starts, keep))
+            sizes = array.array(sizes.typecode, itertools.compress(sizes, keep))
+            module_ids = array.array(
+                module_ids.typecode, itertools.compress(module_ids, keep)
+            )
+            if hit_counts is not None:
+                hit_counts = array.array(
+                    hit_counts.typecode, itertools.compress(hit_counts, keep)
+                )
 
+        return CoverageArrays(
+            header, modules, module_version, starts, sizes, module_ids, hit_counts
+        )
 
+    @staticmethod
+    @contextlib.contextmanager
+    def open_buffer(path: str):
+        """Yield the contents of a drcov file on disk as a bytes-like buffer.
+
+        Plain files are memory-mapped; .gz files are decompressed into memory.
+        """
+        if path.endswith(_GZIP_SUFFIX):
+            with gzip.open(path, "rb") as f:
+                yield f.read()
+            return
+
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not (stat.S_ISREG(st.st_mode) and st.st_size > 0):
+                # Empty files cannot be mapped, and pipes, FIFOs or character
+                # devices (e.g. process substitution, /dev/stdin) report no
+                # size at all, so read them instead
+                yield f.read()
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
 
 # --- Writer Implementation ---
 
 
+# Formatter for each module table column, keyed by column name
+_MODULE_COLUMN_FORMATTERS: Dict[str, Callable[[ModuleEntry], str]] = {
+    "id": lambda m: str(m.id),
+    "base": lambda m: f"0x{m.base:x}",
+    "start": lambda m: f"0x{m.base:x}",
+    "end": lambda m: f"0x{m.end:x}",
+    "entry": lambda m: f"0x{m.entry:x}",
+    "path": lambda m: m.path,
+    "containing_id": lambda m: str(m.containing_id or -1),
+    "offset": lambda m: f"0x{m.offset or 0:x}",
+    "checksum": lambda m: f"0x{m.checksum or 0:x}",
+    "timestamp": lambda m: f"0x{m.timestamp or 0:x}",
+}
+
+
 class _Writer:
     @staticmethod
-    def write_stream(data: CoverageData, stream: Union[TextIO, BinaryIO]):
-        data.validate()
+    def write_stream(
+        data: CoverageData, stream: Union[TextIO, BinaryIO], validate: bool = True
+    ):
+        if validate:
+            data.validate()
 
         # Determine if we need to write text or bytes
         is_binary_stream = isinstance(stream, io.BufferedIOBase)
 
-        def write_str(s: str):
-            if is_binary_stream:
-                stream.write(s.encode("utf-8"))
-            else:
-                stream.write(s)
-
-        write_str(data.header.to_string())
-        write_str("\n")
-
-        _Writer._write_module_table(data, write_str)
-        write_str("\n")
+        # Render the whole text region first, then encode and write it once
+        text_parts = [data.header.to_string(), "\n"]
+        _Writer._write_module_table(data, text_parts.append)
+        text_parts.append("\n")
+        text = "".join(text_parts)
+        stream.write(text.encode("utf-8") if is_binary_stream else text)
 
         # For BB table, we must write to a binary stream
         if not is_binary_stream:
@@ -729,6 +997,8 @@ class _Writer:
 
     @staticmethod
     def _get_columns_string(data: CoverageData) -> str:
+        # Scanned once per write rather than cached on CoverageData: modules
+        # are mutable in place (e.g. checksum/timestamp set after add_module)
         has_windows_fields = any(
             m.checksum is not None or m.timestamp is not None for m in data.modules
         )
@@ -768,53 +1038,52 @@ class _Writer:
             write_str(f"{_COLUMNS_PREFIX}{columns_str}\n")
             columns = [c.strip() for c in columns_str.split(",")]
 
-        for mod in data.modules:
-            parts = []
-            for col in columns:
-                if col == "id":
-                    parts.append(str(mod.id))
-                elif col in ("base", "start"):
-                    parts.append(f"0x{mod.base:x}")
-                elif col == "end":
-                    parts.append(f"0x{mod.end:x}")
-                elif col == "entry":
-                    parts.append(f"0x{mod.entry:x}")
-                elif col == "path":
-                    parts.append(mod.path)
-                elif col == "containing_id":
-                    parts.append(str(mod.containing_id or -1))
-                elif col == "offset":
-                    parts.append(f"0x{mod.offset or 0:x}")
-                elif col == "checksum":
-                    parts.append(f"0x{mod.checksum or 0:x}")
-                elif col == "timestamp":
-                    parts.append(f"0x{mod.timestamp or 0:x}")
-            write_str(", ".join(parts) + "\n")
+        # Resolve each column's formatter once rather than per module
+        formatters = [
+            _MODULE_COLUMN_FORMATTERS[col]
+            for col in columns
+            if col in _MODULE_COLUMN_FORMATTERS
+        ]
+        # Render every row first and emit the whole table body in one write
+        rows = [", ".join([fmt(mod) for fmt in formatters]) for mod in data.modules]
+        if rows:
+            write_str("\n".join(rows) + "\n")
 
     @staticmethod
     def _write_bb_table(blocks: List[BasicBlock], stream: BinaryIO):
-        header = f"{_BB_TABLE_PREFIX}{len(blocks)} bbs\n"
-        stream.write(header.encode("utf-8"))
-
-        if not blocks:
-            return
-
-        packed_data = b"".join(
-            struct.pack("<IHH", bb.start, bb.size, bb.module_id) for bb in blocks
-        )
+        header = f"{_BB_TABLE_PREFIX}{len(blocks)} bbs\n".encode("utf-8")
+
+        # Lay out the header and every entry in one exactly-sized buffer and
+        # issue one write, so in-memory sinks grow once per table
+        packed_data = bytearray(len(header) + _BB_ENTRY_SIZE * len(blocks))
+        packed_data[: len(header)] = header
+        pack_into = _BB_STRUCT.pack_into
+        offset = len(header)
+        for bb in blocks:
+            pack_into(packed_data, offset, bb.start, bb.size, bb.module_id)
+            offset += _BB_ENTRY_SIZE
         stream.write(packed_data)
 
     @staticmethod
     def _write_hit_count_table(hit_counts: List[int], stream: BinaryIO):
         """Write hit count table to stream."""
-        header = f"{_HIT_COUNT_TABLE_PREFIX}version 1, count {len(hit_counts)}\n"
-        stream.write(header.encode("utf-8"))
+        header = (
+            f"{_HIT_COUNT_TABLE_PREFIX}version 1, count {len(hit_counts)}\n"
+        ).encode("utf-8")
 
-        if not hit_counts:
-            return
+        # Pack all counters in one C-level pass (a memcpy on little-endian hosts)
+        try:
+            counts = array.array(_U32_TYPECODE, hit_counts)
+        except OverflowError as e:
+            raise DrCovError(f"Hit count does not fit in uint32: {e}")
+        if sys.byteorder != "little":
+            counts.byteswap()
 
-        packed_data = b"".join(struct.pack("<I", count) for count in hit_counts)
-        stream.write(packed_data)
+        # Gathered write: the counters are handed over as a byte view rather
+        # than copied next to the header into a staging buffer; casting to
+        # bytes keeps len() and slicing byte-based for wrapping sinks
+        with memoryview(counts) as view, view.cast("B") as counts_bytes:
+            stream.writelines((header, counts_bytes))
 
 
 # --- Public API Functions ---
@@ -822,63 +1091,154 @@ class _Writer:
 T = TypeVar("T")
 
 
-def read(filepath_or_stream: Union[str, TextIO], permissive: bool = False) -> CoverageData:
+def _read_buffer(
+    filepath_or_stream: Union[str, BinaryIO, TextIO],
+    parse: Callable[..., T],
+    permissive: bool,
+) -> T:
+    """Runs a buffer parser over a file path or the full contents of a stream."""
+    if isinstance(filepath_or_stream, str):
+        with _Parser.open_buffer(filepath_or_stream) as data:
+            return parse(data, permissive=permissive)
+
+    stream = filepath_or_stream
+    content = stream.buffer.read() if hasattr(stream, "buffer") else stream.read()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return parse(content, permissive=permissive)
+
+
+def read(
+    filepath_or_stream: Union[str, BinaryIO, TextIO], permissive: bool = False
+) -> CoverageData:
     """
-    Reads and parses a DrCov file from a path or a text stream.
+    Reads and parses a DrCov file from a path or a stream.
 
     Args:
-        filepath_or_stream: Path to the .drcov file or a stream opened in text mode.
+        filepath_or_stream: Path to the .drcov file (decompressed on the fly if it
+            ends in .gz), or a stream opened in binary mode (text-mode file streams
+            are read through their underlying buffer).
         permissive: If True, warnings are printed for invalid data but parsing continues.
 
     Returns:
         A CoverageData object.
 
+    Raises:
+        DrCovError: If parsing fails.
+        FileNotFoundError: If the file path does not exist.
+    """
+    return _read_buffer(filepath_or_stream, _Parser.parse_bytes, permissive)
+
+
+def read_summary(
+    filepath_or_stream: Union[str, BinaryIO, TextIO], permissive: bool = False
+) -> CoverageSummary:
+    """
+    Reads per-module coverage totals from a DrCov file.
+
+    Unlike read(), no BasicBlock objects are created: the BB table is aggregated
+    straight from the (memory-mapped) file, which keeps memory flat for very
+    large traces.
+
+    Args:
+        filepath_or_stream: Path to the .drcov file (decompressed on the fly if it
+            ends in .gz), or a stream opened in binary mode.
+        permissive: If True, warnings are printed for invalid data but parsing continues.
+
+    Returns:
+        A CoverageSummary object.
+
+    Raises:
+        DrCovError: If parsing fails.
+        FileNotFoundError: If the file path does not exist.
+    """
+    return _read_buffer(filepath_or_stream, _Parser.summarize_bytes, permissive)
+
+
+def read_arrays(
+    filepath_or_stream: Union[str, BinaryIO, TextIO], permissive: bool = False
+) -> CoverageArrays:
+    """
+    Reads a DrCov file into parallel typed arrays instead of BasicBlock objects.
+
+    The BB table is decoded in bulk into uint32/uint16 columns (and the hit
+    count table, if present, into a uint32 array), which suits arithmetic over
+    very large traces.
+
+    Args:
+        filepath_or_stream: Path to the .drcov file (decompressed on the fly if it
+            ends in .gz), or a stream opened in binary mode.
+        permissive: If True, warnings are printed for invalid data but parsing continues.
+
+    Returns:
+        A CoverageArrays object.
+
+    Raises:
+        DrCovError: If parsing fails.
+        FileNotFoundError: If the file path does not exist.
+    """
+    return _read_buffer(filepath_or_stream, _Parser.parse_arrays, permissive)
+
+
+def read_modules(
+    filepath_or_stream: Union[str, BinaryIO, TextIO],
+) -> Tuple[FileHeader, List[ModuleEntry], ModuleTableVersion, int]:
+    """
+    Reads only the header and module table of a DrCov file.
+
+    Parsing stops at the BB table header, so the (potentially very large)
+    binary tables are never read.
+
+    Args:
+        filepath_or_stream: Path to the .drcov file (decompressed on the fly if it
+            ends in .gz), or a stream opened in binary mode.
+
+    Returns:
+        A (header, modules, module_version, basic_block_count) tuple.
+
     Raises:
         DrCovError: If parsing fails.
         FileNotFoundError: If the file path does not exist.
     """
     if isinstance(filepath_or_stream, str):
-        # Read the entire file as binary, then parse
-        with open(filepath_or_stream, "rb") as f:
-            binary_data = f.read()
-        
-        # Find the split point between text and binary parts
-        bb_table_start = binary_data.find(b"BB Table:")
-        if bb_table_start == -1:
-            # No BB table, parse as text only
-            text_data = binary_data.decode("utf-8", errors="ignore")
-            from io import StringIO
-            return _Parser.parse_text_only(StringIO(text_data), permissive=permissive)
+        if filepath_or_stream.endswith(_GZIP_SUFFIX):
+            opener = gzip.open
         else:
-            # Split at BB table
-            text_part = binary_data[:bb_table_start].decode("utf-8", errors="ignore")
-            bb_part = binary_data[bb_table_start:]
-            
-            from io import StringIO, BytesIO
-            text_stream = StringIO(text_part)
-            bb_stream = BytesIO(bb_part)
-            
-            return _Parser.parse_with_binary(text_stream, bb_stream, permissive=permissive)
-    else:
-        return _Parser.parse_stream(filepath_or_stream, permissive=permissive)
+            opener = open
+        with opener(filepath_or_stream, "rb") as f:
+            return _Parser.parse_prefix(f)
+
+    stream = filepath_or_stream
+    return _Parser.parse_prefix(stream.buffer if hasattr(stream, "buffer") else stream)
 
 
-def write(data: CoverageData, filepath_or_stream: Union[str, BinaryIO]):
+def write(
+    data: CoverageData,
+    filepath_or_stream: Union[str, BinaryIO],
+    validate: bool = True,
+):
     """
     Writes coverage data to a .drcov file.
 
     Args:
         data: The CoverageData object to write.
-        filepath_or_stream: Path to the output file or a stream opened in binary mode.
+        filepath_or_stream: Path to the output file (gzip-compressed if it ends in
+            .gz) or a stream opened in binary mode.
+        validate: If False, skips validation (for data that was just validated,
+            e.g. by CoverageBuilder.build()).
 
     Raises:
         DrCovError: If writing fails.
     """
     if isinstance(filepath_or_stream, str):
-        with open(filepath_or_stream, "wb") as f:
-            _Writer.write_stream(data, f)
+        if filepath_or_stream.endswith(_GZIP_SUFFIX):
+            opener = gzip.open
+        else:
+            opener = open
+        with opener(filepath_or_stream, "wb") as f:
+            _Writer.write_stream(data, f, validate=validate)
     else:
-        _Writer.write_stream(data, filepath_or_stream)
+        _Writer.write_stream(data, filepath_or_stream, validate=validate)
 
 
 def builder() -> CoverageBuilder:
@@ -889,12 +1249,17 @@ def builder() -> CoverageBuilder:
 # --- Command-Line Tool ---
 
 
-def _run_analyzer(args: argparse.Namespace):
+def _run_analyzer(args: "argparse.Namespace"):
     """The main logic for the command-line tool."""
     print(f"Analyzing DrCov file: {args.file}\n")
 
     try:
-        coverage_data = read(args.file)
+        # Only the detailed view needs the individual basic blocks
+        if args.detailed:
+            coverage_data = read(args.file)
+            summary = coverage_data.summarize()
+        else:
+            summary = read_summary(args.file)
     except FileNotFoundError:
         print(f"Error: File not found at '{args.file}'", file=sys.stderr)
         sys.exit(1)
@@ -905,28 +1270,25 @@ def _run_analyzer(args: argparse.Namespace):
     # --- Print Header and Summary ---
     print("=== DrCov File Analysis ===")
     print(f"File:                 {args.file}")
-    print(f"Version:              {coverage_data.header.version}")
-    print(f"Flavor:               {coverage_data.header.flavor}")
-    print(f"Module Table Version: {coverage_data.module_version.value}\n")
+    print(f"Version:              {summary.header.version}")
+    print(f"Flavor:               {summary.header.flavor}")
+    print(f"Module Table Version: {summary.module_version.value}\n")
 
     print("=== Summary ===")
-    print(f"Total Modules:        {len(coverage_data.modules)}")
-    print(f"Total Basic Blocks:   {len(coverage_data.basic_blocks)}")
-
-    total_coverage_bytes = sum(bb.size for bb in coverage_data.basic_blocks)
-    print(f"Total Coverage:       {total_coverage_bytes} bytes\n")
+    print(f"Total Modules:        {len(summary.modules)}")
+    print(f"Total Basic Blocks:   {summary.total_blocks}")
+    print(f"Total Coverage:       {summary.total_bytes} bytes\n")
 
     # --- Print Module Coverage Summary ---
-    stats = coverage_data.get_coverage_stats()
+    stats = summary.blocks_by_module
+    bytes_by_module = summary.bytes_by_module
     print("=== Module Coverage ===")
     print(f"{'ID':<4} {'Blocks':<8} {'Size':<12} {'Base Address':<20} {'Name'}")
     print("-" * 80)
 
-    for module in coverage_data.modules:
+    for module in summary.modules:
         block_count = stats.get(module.id, 0)
-        module_bytes = sum(
-            bb.size for bb in coverage_data.basic_blocks if bb.module_id == module.id
-        )
+        module_bytes = bytes_by_module.get(module.id, 0)
 
         print(
             f"{module.id:<4} "
@@ -945,32 +1307,36 @@ def _run_analyzer(args: argparse.Namespace):
         )
         print("-" * 80)
 
+        # (base, path) per module ID, resolved once rather than per block
+        module_info = {
+            module_id: (m.base, m.path)
+            for module_id, m in coverage_data.modules_by_id().items()
+        }
+        row_format = "%-8d 0x%-12x %-8d 0x%-16x %s\n"
+
+        # Collect every row and emit them with a single write
+        lines = []
+        append = lines.append
         for bb in coverage_data.basic_blocks:
-            module = coverage_data.find_module(bb.module_id)
-            if module:
-                abs_addr = bb.absolute_address(module)
-                print(
-                    f"{bb.module_id:<8} "
-                    f"{f'0x{bb.start:x}':<14} "
-                    f"{bb.size:<8} "
-                    f"{f'0x{abs_addr:x}':<18} "
-                    f"{module.path}"
+            info = module_info.get(bb.module_id)
+            if info:
+                base, path = info
+                append(
+                    row_format
+                    % (bb.module_id, bb.start, bb.size, base + bb.start, path)
                 )
-        print("")
+        append("\n")
+        sys.stdout.write("".join(lines))
 
     # --- Module-Specific Analysis ---
     if args.module:
         print(f"=== Module-Specific Analysis: '{args.module}' ===")
         found = False
-        for module in coverage_data.modules:
+        for module in summary.modules:
             if args.module.lower() in module.path.lower():
                 found = True
                 block_count = stats.get(module.id, 0)
-                module_bytes = sum(
-                    bb.size
-                    for bb in coverage_data.basic_blocks
-                    if bb.module_id == module.id
-                )
+                module_bytes = bytes_by_module.get(module.id, 0)
 
                 print(f"Module ID:      {module.id}")
                 print(f"Name:           {module.path}")
@@ -986,6 +1352,9 @@ def _run_analyzer(args: argparse.Namespace):
 
 def main():
     """Entry point for the command-line script."""
+    # Imported here so library users do not pay for the CLI's dependencies
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Analyze DrCov code coverage files.",
         formatter_class=argparse.RawTextHelpFormatter,
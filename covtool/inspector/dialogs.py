@@ -64,6 +64,9 @@ class FilterDialog(BaseDialog):
     def __init__(self, inspector):
         super().__init__(inspector.main_loop, inspector.main_widget)
         self.inspector = inspector
+        self._overlay = None  # built on first show, then reused
+        self._pile = None
+        self._edit_index = None
 
     def _on_ok(self):
         filter_text = self.edit_widget.get_edit_text()
@@ -71,41 +74,52 @@ class FilterDialog(BaseDialog):
         super()._on_ok()
 
     def show(self):
+        if self._overlay is None:
+            self._overlay = self._create_overlay()
+
+        # Reuse the built dialog; only the edit text and focus are reset
+        self.edit_widget.set_edit_text(self.inspector.current_filter)
+        self.edit_widget.set_edit_pos(len(self.inspector.current_filter))
+        self._pile.focus_position = self._edit_index
+        self.main_loop.widget = self._overlay
+
+    def _create_overlay(self):
+        """Build the dialog widgets"""
+
         def on_clear(_button):
             self.edit_widget.set_edit_text("")
 
-        self.edit_widget = urwid.Edit("Filter: ", self.inspector.current_filter)
+        self.edit_widget = urwid.Edit("Filter: ")
         ok_button = urwid.Button("Apply", lambda _: self._on_ok())
         clear_button = urwid.Button("Clear", on_clear)
         cancel_button = urwid.Button("Cancel", lambda _: self._on_cancel())
 
-        pile = urwid.Pile(
-            [
-                urwid.Text("Enter module name filter (case-insensitive):"),
-                urwid.Text("Examples: 'libc', 'kernel', 'myapp', 'lib'"),
-                urwid.Text("Tip: Use partial names to match multiple modules"),
-                urwid.Divider(),
-                self.edit_widget,
-                urwid.Divider(),
-                urwid.Columns(
-                    [
-                        ("pack", ok_button),
-                        ("pack", urwid.Text("  ")),
-                        ("pack", clear_button),
-                        ("pack", urwid.Text("  ")),
-                        ("pack", cancel_button),
-                    ]
-                ),
-            ]
-        )
+        widgets = [
+            urwid.Text("Enter module name filter (case-insensitive):"),
+            urwid.Text("Examples: 'libc', 'kernel', 'myapp', 'lib'"),
+            urwid.Text("Tip: Use partial names to match multiple modules"),
+            urwid.Divider(),
+            self.edit_widget,
+            urwid.Divider(),
+            urwid.Columns(
+                [
+                    ("pack", ok_button),
+                    ("pack", urwid.Text("  ")),
+                    ("pack", clear_button),
+                    ("pack", urwid.Text("  ")),
+                    ("pack", cancel_button),
+                ]
+            ),
+        ]
+        self._pile = urwid.Pile(widgets)
+        self._edit_index = widgets.index(self.edit_widget)
 
-        overlay = self._create_dialog_wrapper(
-            pile,
+        return self._create_dialog_wrapper(
+            self._pile,
             "Filter Modules",
             self.inspector.DIALOG_WIDTH,
             self.inspector.FILTER_DIALOG_HEIGHT,
         )
-        self.main_loop.widget = overlay
 
 
 class SearchDialog(BaseDialog):
@@ -177,7 +191,7 @@ class HitCountDialog(BaseDialog):
             except ValueError:
                 # Invalid input, ignore
                 pass
-        self.inspector._refresh_block_list()
+        self.inspector._refresh_hitcount_filter()
         self.inspector._update_view()
         self.inspector._update_header_footer()
         super()._on_ok()
@@ -357,8 +371,19 @@ class HelpDialog:
 
     def __init__(self, inspector):
         self.inspector = inspector
+        self._overlay = None  # built on first show, then reused
 
     def show(self):
+        if self._overlay is None:
+            self._overlay = self._create_overlay()
+
+        # The help text is static; only the screen underneath can change
+        self._overlay.bottom_w = self.inspector.main_widget
+        self.inspector.main_loop.widget = self._overlay
+
+    def _create_overlay(self):
+        """Build the help text widgets"""
+
         def on_close(_button):
             self.inspector.main_loop.widget = self.inspector.main_widget
 
@@ -403,7 +428,7 @@ class HelpDialog:
         pile = urwid.Pile(text_widgets + [urwid.Divider(), close_button])
         dialog = urwid.Filler(urwid.LineBox(pile, title="Help"), valign="middle")
 
-        overlay = urwid.Overlay(
+        return urwid.Overlay(
             dialog,
             self.inspector.main_widget,
             align="center",
@@ -411,4 +436,3 @@ class HelpDialog:
             valign="middle",
             height=self.inspector.HELP_DIALOG_HEIGHT,
         )
-        self.inspector.main_loop.widget = overlay
@@ -1,8 +1,11 @@
 """Main CoverageInspector class and utilities"""
 
 import os
+import threading
 import urwid
-from collections import defaultdict
+from array import array
+from functools import lru_cache
+from itertools import compress
 
 from ..core import CoverageSet
 from .dialogs import (
@@ -13,7 +16,31 @@ from .dialogs import (
     SizeFilterDialog,
     HelpDialog,
 )
-from .views import ViewCreator
+from .views import BlockListView, ViewCreator, _basename
+
+
+def _set_text_if_changed(widget, text):
+    """Set a Text widget's text, skipping the redraw when it is unchanged"""
+    if widget.text != text:
+        widget.set_text(text)
+
+
+def _order_block_rows(hit_column, sort_mode, hitcount_filter, address_rows=None):
+    """Order address-sorted block rows for display
+
+    Returns the row indices passing the exact hit count filter, in address
+    order or by descending hits (address_rows, the address order for the same
+    filter, is required for the latter).
+    """
+    if sort_mode == "hits":
+        # Sort by hits (descending); the stable sort keeps address order on ties
+        return sorted(address_rows, key=hit_column.__getitem__, reverse=True)
+    if hitcount_filter is None:
+        return range(len(hit_column))
+    # One C-level pass over the hit column; the rows stay in address order, so
+    # no re-sort is needed
+    hit_mask = map(hitcount_filter.__eq__, hit_column)
+    return list(compress(range(len(hit_column)), hit_mask))
 
 
 class CoverageInspector:
@@ -23,7 +50,6 @@ class CoverageInspector:
     MODULE_WIDTH_WITH_HITS = 45
     MODULE_WIDTH_NO_HITS = 50
     BLOCK_MODULE_WIDTH = 35
-    MAX_BLOCKS_DISPLAY = 10000
 
     # Size formatting thresholds
     SIZE_MB_THRESHOLD = 1024 * 1024
@@ -59,6 +85,9 @@ class CoverageInspector:
     HITS_FIELD_WIDTH = 8
     OFFSET_FIELD_WIDTH = 12
 
+    # Block orderings kept per (sort mode, exact hit count filter)
+    BLOCK_ORDER_CACHE_SIZE = 8
+
     def __init__(self, coverage: CoverageSet, filename: str):
         self.coverage = coverage
         self.filename = filename
@@ -68,7 +97,16 @@ class CoverageInspector:
         # UI state
         self.current_view = "modules"  # modules, blocks, stats
         self.module_list = []
-        self.block_list = []
+        self.block_list = []  # row indices into the block columns, in display order
+
+        # Filtered blocks as parallel columns in address order
+        self._block_rows = []
+        self._block_hits = array("Q")
+        self._block_modules = {}  # module id -> (module, display name)
+        self._block_lines = []  # formatted display lines, filled in on demand
+        self._block_orders = {}  # (sort mode, hitcount filter) -> ordered rows
+        self._block_list_stale = True  # built on first use, see _ensure_block_list
+        self._block_order_stale = True
         self.scroll_offset = 0
 
         # Block view sorting and filtering
@@ -84,8 +122,40 @@ class CoverageInspector:
         self.main_widget = None
         self.module_listbox = None
 
-        # View creator
+        # Module filtering runs on a worker thread once the main loop is up;
+        # results come back through a watched pipe (see _apply_filter)
+        self._filter_pipe = None
+        self._filter_generation = 0  # bumped per request, drops stale results
+        self._filter_results = {}  # generation -> worker result or exception
+
+        # Header and footer widgets are built once; updates only replace text
+        self._header_title = urwid.Text("")
+        self._header_stats = urwid.Text("", align="center")
+        self._header_view_status = urwid.Text("", align="center")
+        self._header = urwid.Pile(
+            [
+                urwid.AttrMap(self._header_title, "header_title"),
+                urwid.AttrMap(self._header_stats, "header_stats"),
+            ]
+        )
+        self._header_status_line = urwid.AttrMap(
+            self._header_view_status, "header_stats"
+        )
+        self._header_stats_text = None  # cached until the module list refreshes
+        self._footer_text = urwid.Text("")
+        self._footer = urwid.AttrMap(self._footer_text, "footer")
+
+        # Dialogs with static content, built on first use and reused
+        self._filter_dialog = None
+        self._help_dialog = None
+
+        # View creator and built views, reused until the underlying lists change
         self.view_creator = ViewCreator(self)
+        self._view_cache = {}
+
+        # Sizes repeat heavily across modules and refreshes; memoize the
+        # formatting per instance so the cache doesn't outlive the inspector
+        self._format_size = lru_cache(maxsize=8192)(self._format_size)
 
         self._setup_data()
 
@@ -207,137 +277,332 @@ class CoverageInspector:
         return any(search_lower in target for target in search_targets)
 
     def _passes_all_filters(self, block, hits, module_name, abs_addr):
-        """Check if block passes all active filters"""
+        """Check if block passes all active per-block filters
+
+        The exact hit count filter is applied up front in _build_block_list.
+        """
         return (
-            (self.hitcount_filter is None or hits == self.hitcount_filter)
-            and self._matches_range_filter(hits, self.hitcount_range_filter)
+            self._matches_range_filter(hits, self.hitcount_range_filter)
             and self._matches_range_filter(block.size, self.size_filter)
             and self._matches_search_term(block, module_name, abs_addr)
         )
 
     def _get_module_display_name(self, module, module_id):
         """Get display name for a module"""
-        return os.path.basename(module.path) if module else f"module_{module_id}"
+        return _basename(module.path) if module else f"module_{module_id}"
 
     def _setup_data(self):
         """Prepare data for display"""
+        # The block list is only built once the blocks view asks for it
         self._refresh_module_list()
-        self._refresh_block_list()
 
     def _refresh_module_list(self):
         """Refresh the module list for current filtered coverage"""
-        by_module = self.filtered_coverage.get_coverage_by_module_with_base()
+        data = self.filtered_coverage.data
         self.module_list = []
+        self._view_cache.clear()
+        self._header_stats_text = None
 
-        total_blocks = len(self.filtered_coverage.data.basic_blocks)
+        total_blocks = len(data.basic_blocks)
+        has_hits = data.has_hit_counts()
+        search_lower = self.search_term.lower()
+        format_line = self.view_creator._format_module_line
 
-        # Create block-to-index mapping for efficient hit count lookup
-        block_to_index = (
-            {
-                block: i
-                for i, block in enumerate(self.filtered_coverage.data.basic_blocks)
-            }
-            if self.filtered_coverage.data.has_hit_counts()
-            else {}
-        )
+        # Per-module totals are computed once per coverage set, so search and
+        # reset refreshes only walk the modules
+        totals = self.filtered_coverage.get_module_stats()
 
-        for module_name, blocks in sorted(
-            by_module.items(), key=lambda x: x[0]  # sort by module name
+        for module_name, (block_count, total_size, module_hits) in sorted(
+            totals.items()  # sort by module name
         ):
             # Apply search filter to modules
-            if self.search_term and self.search_term.lower() not in module_name.lower():
+            if search_lower and search_lower not in module_name.lower():
                 continue
 
-            block_count = len(blocks)
-            total_size = sum(block.size for block in blocks)
             percentage = (block_count / total_blocks * 100) if total_blocks > 0 else 0
 
-            # Calculate hit count statistics for this module
-            if self.filtered_coverage.data.has_hit_counts():
-                module_hits = sum(
-                    self.filtered_coverage.data.get_hit_count(block_to_index[block])
-                    for block in blocks
-                )
-            else:
-                # Default hit count of 1 for each block
-                module_hits = block_count
-
-            self.module_list.append(
-                {
-                    "name": module_name,
-                    "blocks": blocks,
-                    "count": block_count,
-                    "size": total_size,
-                    "percentage": percentage,
-                    "hits": module_hits,
-                }
-            )
+            mod_info = {
+                "name": module_name,
+                "count": block_count,
+                "size": total_size,
+                "percentage": percentage,
+                "hits": module_hits,
+            }
+            # Format the display row once per refresh rather than per render
+            mod_info["line"] = format_line(mod_info, has_hits)
+            self.module_list.append(mod_info)
 
     def _refresh_block_list(self):
-        """Refresh the block list for current filtered coverage"""
-        self.block_list = []
+        """Mark the block list for a rebuild from the current filtered coverage"""
+        self._block_list_stale = True
+        self._view_cache.clear()
 
-        # Create block list with hit information
-        blocks_with_hits = self.filtered_coverage.data.get_blocks_with_hits()
+    def _refresh_hitcount_filter(self):
+        """Mark the block list for re-filtering by exact hit count only
 
-        # Cache modules to avoid repeated lookups
-        module_cache = {}
+        The address-sorted block columns don't depend on the exact hit count
+        filter, so they are kept and only the visible rows are recomputed.
+        """
+        self._block_order_stale = True
+        self._view_cache.clear()
+
+    def _ensure_block_list(self):
+        """Build, filter and sort the block list if it is stale"""
+        if self._block_list_stale:
+            self._build_block_list()
+            self._block_list_stale = False
+            self._block_order_stale = True
+        if self._block_order_stale:
+            self._sort_block_list()
+
+    def _build_block_list(self):
+        """Build the filtered block columns in address order"""
+        self._set_block_columns(*self._build_block_columns(self.filtered_coverage))
+
+    def _get_block_filter_key(self):
+        """Get the per-block filter settings the block columns are built for"""
+        return (self.hitcount_range_filter, self.size_filter, self.search_term)
+
+    def _build_block_columns(self, coverage):
+        """Build a coverage set's filtered block columns in address order
+
+        Returns (rows, hits, module_info). Only reads the inspector's filter
+        settings, so it can also run on the filter worker thread.
+        """
+        data = coverage.data
+
+        # Work on the block and hit count columns directly; building a
+        # (block, hits) tuple per block costs more than the filtering itself
+        blocks = data.basic_blocks
+        hit_column = data.hit_counts if data.hit_counts else [1] * len(blocks)
+
+        # Resolve every module and its display name once per refresh
+        module_info = {
+            module_id: (module, self._get_module_display_name(module, module_id))
+            for module_id, module in data.modules_by_id().items()
+        }
+
+        # Only run the per-block filter loop when a range, size or search
+        # filter is active; otherwise every block passes
+        if (
+            self.hitcount_range_filter is not None
+            or self.size_filter is not None
+            or self.search_term
+        ):
+            blocks, hit_column = self._filter_block_columns(
+                blocks, hit_column, module_info
+            )
 
-        for block, hits in blocks_with_hits:
-            # Use cached module lookup
-            if block.module_id not in module_cache:
-                module_cache[block.module_id] = self.filtered_coverage.data.find_module(
-                    block.module_id
-                )
-            module = module_cache[block.module_id]
-            module_name = self._get_module_display_name(module, block.module_id)
-            abs_addr = module.base + block.start if module else None
+        # Sort by address (module_id, then start offset) once per build. The
+        # pair is packed into one int key column so the sort compares ints via
+        # a C-level key lookup instead of calling a lambda per block
+        address_keys = [block.module_id << 32 | block.start for block in blocks]
+        order = sorted(range(len(blocks)), key=address_keys.__getitem__)
+
+        # Keep the rows as parallel columns; module, name and address are
+        # derived per displayed row from the module lookup instead of per block
+        rows = [blocks[i] for i in order]
+        hits = array("Q", [hit_column[i] for i in order])
+        return rows, hits, module_info
+
+    def _set_block_columns(self, rows, hits, module_info, orders=None):
+        """Install built block columns, with any orderings already computed"""
+        self._block_rows = rows
+        self._block_hits = hits
+        self._block_modules = module_info
+        self._block_lines = [None] * len(rows)
+        self._block_orders = dict(orders or {})
+
+    def _filter_block_columns(self, blocks, hit_column, module_info):
+        """Apply the per-block filters, returning the kept blocks and hit counts"""
+        kept_blocks = []
+        kept_hits = []
+
+        for block, hits in zip(blocks, hit_column):
+            info = module_info.get(block.module_id)
+            if info is not None:
+                module, module_name = info
+                abs_addr = module.base + block.start
+            else:
+                module_name = self._get_module_display_name(None, block.module_id)
+                abs_addr = None
 
             # Apply all filters
             if not self._passes_all_filters(block, hits, module_name, abs_addr):
                 continue
-            self.block_list.append(
-                {
-                    "block": block,
-                    "module": module,
-                    "module_name": module_name,
-                    "abs_addr": abs_addr,
-                    "hits": hits,
-                }
-            )
+            kept_blocks.append(block)
+            kept_hits.append(hits)
 
-        # Sort blocks based on current sort mode
-        self._sort_block_list()
+        return kept_blocks, kept_hits
 
     def _sort_block_list(self):
-        """Sort block list based on current sort mode"""
-        if self.block_sort_mode == "hits":
-            # Sort by hits (descending), then by address
-            self.block_list.sort(
-                key=lambda b: (-b["hits"], b["block"].module_id, b["block"].start)
-            )
-        else:
-            # Sort by address (module_id, then start offset)
-            self.block_list.sort(key=lambda b: (b["block"].module_id, b["block"].start))
+        """Order the visible block rows based on current sort mode"""
+        self._view_cache.clear()
+        if self._block_list_stale:
+            self._block_order_stale = True
+            return  # sorted when the list is next built
+        self.block_list = self._get_block_order(
+            self.block_sort_mode, self.hitcount_filter
+        )
+        self._block_order_stale = False
+
+    def _get_block_order(self, sort_mode, hitcount_filter):
+        """Get the rows passing the exact hit count filter in sort mode order
+
+        Orderings are kept until the block columns are rebuilt, so toggling
+        the sort mode or returning to a previous hit count filter is a lookup.
+        """
+        key = (sort_mode, hitcount_filter)
+        order = self._block_orders.get(key)
+        if order is not None:
+            return order
+
+        address_rows = None
+        if sort_mode == "hits":
+            address_rows = self._get_block_order("address", hitcount_filter)
+        order = _order_block_rows(
+            self._block_hits, sort_mode, hitcount_filter, address_rows
+        )
+
+        self._block_orders[key] = order
+        if len(self._block_orders) > self.BLOCK_ORDER_CACHE_SIZE:
+            del self._block_orders[next(iter(self._block_orders))]
+        return order
+
+    def _get_block_row(self, index):
+        """Get (block, module_name, abs_addr, hits) for a position in the block list"""
+        row = self.block_list[index]
+        block = self._block_rows[row]
+        info = self._block_modules.get(block.module_id)
+        if info is None:
+            module_name = self._get_module_display_name(None, block.module_id)
+            return block, module_name, None, self._block_hits[row]
+        module, module_name = info
+        return block, module_name, module.base + block.start, self._block_hits[row]
+
+    def _get_block_line(self, index):
+        """Get the formatted display line for a position in the block list
+
+        Lines are formatted the first time a row is shown and kept per row, so
+        scrolling back and re-sorting reuse them until the list is rebuilt.
+        """
+        row = self.block_list[index]
+        line = self._block_lines[row]
+        if line is None:
+            line = self.view_creator._format_block_line(*self._get_block_row(index))
+            self._block_lines[row] = line
+        return line
 
     def _apply_filter(self, filter_text: str):
         """Apply module filter"""
         self.current_filter = filter_text
-        if filter_text.strip():
-            # remove @0xXXXX suffix if present for filtering
-            base_filter = filter_text.strip().split("@")[0]
-            self.filtered_coverage = self.coverage.filter_by_module(base_filter)
-        else:
-            self.filtered_coverage = self.coverage
+        self._filter_generation += 1
+
+        if self._filter_pipe is None:
+            # No main loop to hand results back to; filter inline
+            self._install_filter(self._filter_coverage(filter_text))
+            return
+
+        # Filtering large coverage takes a while, so show a placeholder and
+        # do the work off the UI thread to keep the screen responsive
+        self.content_area.original_widget = urwid.Filler(
+            urwid.Text("Filtering...", align="center"), valign="middle"
+        )
+        self._update_header_footer()
+        threading.Thread(
+            target=self._filter_worker,
+            args=(self._filter_generation, filter_text),
+            daemon=True,
+        ).start()
+
+    def _filter_coverage(self, filter_text):
+        """Get the coverage matching a module filter"""
+        if not filter_text.strip():
+            return self.coverage
+
+        # remove @0xXXXX suffix if present for filtering
+        base_filter = filter_text.strip().split("@")[0]
+        filtered = self.coverage.filter_by_module(base_filter)
+        filtered.get_module_stats()  # warm the per-module totals too
+        return filtered
+
+    def _filter_worker(self, generation, filter_text):
+        """Filter coverage on a worker thread and wake the main loop
+
+        Besides the filtered coverage, the block columns and the current
+        ordering are built here too, so installing the result is cheap.
+        """
+        try:
+            filter_key = self._get_block_filter_key()
+            sort_mode, hitcount_filter = self.block_sort_mode, self.hitcount_filter
+            filtered = self._filter_coverage(filter_text)
+            rows, hits, module_info = self._build_block_columns(filtered)
+
+            orders = {}
+            address_rows = _order_block_rows(hits, "address", hitcount_filter)
+            orders[("address", hitcount_filter)] = address_rows
+            if sort_mode == "hits":
+                orders[("hits", hitcount_filter)] = _order_block_rows(
+                    hits, "hits", hitcount_filter, address_rows
+                )
+            result = (filtered, (filter_key, rows, hits, module_info, orders))
+        except Exception as e:
+            result = e  # reported by _on_filter_done
+        finally:
+            if generation == self._filter_generation:
+                # Keyed by generation so a slower, superseded worker can never
+                # overwrite the result of a newer one
+                self._filter_results[generation] = result
+            # Always wake the main loop, even on failure, so the placeholder
+            # never outlives the worker
+            os.write(self._filter_pipe, b".")
+
+    def _on_filter_done(self, data):
+        """Install a finished filter result on the main loop thread"""
+        generation = self._filter_generation
+        for finished in list(self._filter_results):
+            if finished != generation:
+                del self._filter_results[finished]  # superseded, drop it
+
+        result = self._filter_results.pop(generation, None)
+        if isinstance(result, Exception):
+            self._view_cache.clear()
+            self.content_area.original_widget = urwid.Filler(
+                urwid.Text(f"Filtering failed: {result}", align="center"),
+                valign="middle",
+            )
+        elif result is not None:
+            self._install_filter(*result)
+        return True  # keep the pipe open for later filters
+
+    def _install_filter(self, filtered_coverage, block_columns=None):
+        """Show the lists for newly filtered coverage
+
+        block_columns, when built ahead by the filter worker, is used unless
+        the per-block filters changed while it was being built.
+        """
+        self.filtered_coverage = filtered_coverage
 
         self._refresh_module_list()
         self._refresh_block_list()
+        if block_columns is not None:
+            filter_key, rows, hits, module_info, orders = block_columns
+            if filter_key == self._get_block_filter_key():
+                self._set_block_columns(rows, hits, module_info, orders)
+                self._block_list_stale = False
+                self._block_order_stale = True  # picked from the built orders
+
         self._update_view()
         self._update_header_footer()
 
     def _update_view(self):
         """Update the current view"""
-        if self.current_view == "modules":
+        content = self._view_cache.get(self.current_view)
+        if content is not None:
+            # Reuse the view built for the current lists (keeps scroll position)
+            if self.current_view == "modules" and isinstance(content, urwid.Frame):
+                self.module_listbox = content.body
+        elif self.current_view == "modules":
             content = self.view_creator.create_modules_view()
         elif self.current_view == "blocks":
             content = self.view_creator.create_blocks_view()
@@ -346,7 +611,13 @@ class CoverageInspector:
         else:
             content = urwid.Filler(urwid.Text("Unknown view"), valign="middle")
 
-        self.content_area.original_widget = content
+        if self.current_view in ("modules", "blocks", "stats"):
+            self._view_cache[self.current_view] = content
+
+        # Swapping the widget invalidates the whole body, so skip it when the
+        # same view is already shown
+        if self.content_area.original_widget is not content:
+            self.content_area.original_widget = content
 
     def _update_header_footer(self):
         """Update header and footer"""
@@ -354,8 +625,10 @@ class CoverageInspector:
         header = self._create_header()
         footer = self._create_footer()
 
-        self.main_widget.header = header
-        self.main_widget.footer = footer
+        if self.main_widget.header is not header:
+            self.main_widget.header = header
+        if self.main_widget.footer is not footer:
+            self.main_widget.footer = footer
 
     def _create_footer(self):
         """Create clean footer with essential controls"""
@@ -376,11 +649,12 @@ class CoverageInspector:
 
         help_text = base_help + view_help
 
-        return urwid.AttrMap(urwid.Text(help_text), "footer")
+        _set_text_if_changed(self._footer_text, help_text)
+        return self._footer
 
     def _create_header(self):
         """Create header with better formatting"""
-        filename = os.path.basename(self.filename)
+        filename = _basename(self.filename)
 
         # Create title with coverage summary
         if self.current_filter:
@@ -388,89 +662,98 @@ class CoverageInspector:
         else:
             title = f"Coverage Inspector: {filename}"
 
+        if self._header_stats_text is None:
+            self._header_stats_text = self._get_header_stats()
+        stats = self._header_stats_text
+
+        # Add view-specific status for blocks view
+        view_status = ""
+        if self.current_view == "blocks":
+            self._ensure_block_list()
+        if self.current_view == "blocks" and self.block_list:
+            view_status = self._get_block_view_status()
+
+        # Update the multi-line header in place
+        _set_text_if_changed(self._header_title, title)
+        _set_text_if_changed(self._header_stats, stats)
+        _set_text_if_changed(self._header_view_status, view_status)
+
+        contents = self._header.contents
+        if view_status and len(contents) == 2:
+            contents.append((self._header_status_line, self._header.options()))
+        elif not view_status and len(contents) == 3:
+            contents.pop()
+
+        return self._header
+
+    def _get_header_stats(self):
+        """Get the header's module, block and hit count summary line"""
         # Add quick stats with percentages
-        total_blocks = len(self.coverage.data.basic_blocks)
-        filtered_blocks = len(self.filtered_coverage.data.basic_blocks)
+        data = self.coverage.data
+        total_blocks = len(data.basic_blocks)
+        filtered_blocks = len(self.filtered_coverage)
+        module_count = len(self.module_list)
 
         # Add hit count info to stats
         hit_info = ""
-        if self.coverage.data.has_hit_counts():
-            total_hits = sum(self.coverage.data.hit_counts)
+        if data.has_hit_counts():
+            hit_counts = data.hit_counts
+            total_hits = sum(hit_counts)
             if self.current_filter:
-                filtered_hits = sum(
-                    self.coverage.data.get_hit_count(i)
-                    for i, block in enumerate(self.coverage.data.basic_blocks)
-                    if block in self.filtered_coverage.blocks
-                )
+                # The filtered coverage keeps every block of the matching
+                # modules with its hit count, so its hit column is exactly the
+                # filtered blocks' hits; no membership test per block needed
+                filtered_hits = sum(self.filtered_coverage.data.hit_counts or ())
                 hit_info = f" | Hits: {filtered_hits:,}/{total_hits:,}"
             else:
                 hit_info = f" | Hits: {total_hits:,}"
 
         if self.current_filter and total_blocks > 0:
             filter_pct = (filtered_blocks / total_blocks) * 100
-            stats = f"Modules: {len(self.module_list)} | Blocks: {filtered_blocks:,}/{total_blocks:,} ({filter_pct:.1f}%){hit_info}"
+            stats = f"Modules: {module_count} | Blocks: {filtered_blocks:,}/{total_blocks:,} ({filter_pct:.1f}%){hit_info}"
         else:
-            stats = f"Modules: {len(self.module_list)} | Blocks: {filtered_blocks:,}{hit_info}"
+            stats = f"Modules: {module_count} | Blocks: {filtered_blocks:,}{hit_info}"
 
-        # Add view-specific status for blocks view
-        view_status = ""
-        if self.current_view == "blocks" and self.block_list:
-            block_count = len(self.block_list)
-            displayed = min(10000, block_count)
+        return stats
 
-            status_parts = []
-            if block_count > 10000:
-                status_parts.append(f"Showing {displayed:,} of {block_count:,}")
-            else:
-                status_parts.append(f"{block_count:,} blocks")
+    def _get_block_view_status(self):
+        """Get the blocks view status line (count, sort mode and filters)"""
+        block_count = len(self.block_list)
 
-            if self.block_sort_mode == "hits":
-                status_parts.append("sorted by hits")
-            else:
-                status_parts.append("sorted by address")
-
-            if self.hitcount_filter is not None:
-                status_parts.append(f"hits={self.hitcount_filter}")
-
-            if self.hitcount_range_filter is not None:
-                min_val, max_val, op = self.hitcount_range_filter
-                if op == "range":
-                    status_parts.append(f"hits={min_val}-{max_val}")
-                else:
-                    status_parts.append(f"hits{op}{min_val}")
-
-            if self.size_filter is not None:
-                min_val, max_val, op = self.size_filter
-                if op == "range":
-                    status_parts.append(f"size={min_val}-{max_val}")
-                else:
-                    status_parts.append(f"size{op}{min_val}")
-
-            if self.search_term:
-                status_parts.append(f"search='{self.search_term}'")
-
-            # Add general hit count info
-            if self.filtered_coverage.data.has_hit_counts():
-                status_parts.append("with hit counts")
-            else:
-                status_parts.append("no hit counts")
+        status_parts = [f"{block_count:,} blocks"]
 
-            view_status = " | ".join(status_parts)
+        if self.block_sort_mode == "hits":
+            status_parts.append("sorted by hits")
+        else:
+            status_parts.append("sorted by address")
 
-        # Create multi-line header
-        header_lines = [
-            urwid.AttrMap(urwid.Text(title), "header_title"),
-            urwid.AttrMap(urwid.Text(stats, align="center"), "header_stats"),
-        ]
+        if self.hitcount_filter is not None:
+            status_parts.append(f"hits={self.hitcount_filter}")
 
-        if view_status:
-            header_lines.append(
-                urwid.AttrMap(urwid.Text(view_status, align="center"), "header_stats")
-            )
+        if self.hitcount_range_filter is not None:
+            min_val, max_val, op = self.hitcount_range_filter
+            if op == "range":
+                status_parts.append(f"hits={min_val}-{max_val}")
+            else:
+                status_parts.append(f"hits{op}{min_val}")
+
+        if self.size_filter is not None:
+            min_val, max_val, op = self.size_filter
+            if op == "range":
+                status_parts.append(f"size={min_val}-{max_val}")
+            else:
+                status_parts.append(f"size{op}{min_val}")
+
+        if self.search_term:
+            status_parts.append(f"search='{self.search_term}'")
 
-        header_content = urwid.Pile(header_lines)
+        # Add general hit count info
+        if self.filtered_coverage.data.has_hit_counts():
+            status_parts.append("with hit counts")
+        else:
+            status_parts.append("no hit counts")
 
-        return header_content
+        return " | ".join(status_parts)
 
     def _handle_input(self, key):
         """Enhanced input handling"""
@@ -493,7 +776,9 @@ class CoverageInspector:
         elif key == "r":
             self._reset_all_filters()
         elif key == "f":
-            FilterDialog(self).show()
+            if self._filter_dialog is None:
+                self._filter_dialog = FilterDialog(self)
+            self._filter_dialog.show()
         elif key == "s" and self.current_view == "blocks":
             self._toggle_block_sort()
         elif key == "c" and self.current_view == "blocks":
@@ -505,9 +790,12 @@ class CoverageInspector:
         elif key == "/":
             SearchDialog(self).show()
         elif key in ("h", "?"):
-            HelpDialog(self).show()
+            if self._help_dialog is None:
+                self._help_dialog = HelpDialog(self)
+            self._help_dialog.show()
         elif key == "ctrl l":
             # Refresh screen
+            self._view_cache.clear()
             self._update_view()
             self._update_header_footer()
         elif key in ("j", "k", "J", "K"):
@@ -519,51 +807,55 @@ class CoverageInspector:
 
     def _handle_vi_navigation(self, key):
         """Handle vi-style navigation (j/k/J/K)"""
-        # Get the current focused widget
-        focused_widget = None
+        # Move the focus directly rather than replaying arrow keys through
+        # the widget's keypress handling
+        if key in ("j", "k"):
+            delta = 1
+        else:
+            delta = self._get_page_rows()
+        if key in ("k", "K"):
+            delta = -delta
 
         if self.current_view == "modules" and self.module_listbox:
-            focused_widget = self.module_listbox
-        elif self.current_view == "blocks" or self.current_view == "stats":
-            # For blocks and stats views, we need to get the listbox from content area
-            if hasattr(self.content_area, "original_widget"):
-                focused_widget = self.content_area.original_widget
-                if hasattr(focused_widget, "original_widget"):
-                    focused_widget = focused_widget.original_widget
-
-        if not focused_widget or not hasattr(focused_widget, "keypress"):
-            return
+            listbox = self.module_listbox
+            if not self.module_list:
+                return
+            position = listbox.focus_position + delta
+            position = max(min(position, len(self.module_list) - 1), 0)
+            listbox.set_focus(position, "above" if delta > 0 else "below")
+        elif self.current_view == "blocks":
+            content = self.content_area.original_widget
+            if isinstance(content, BlockListView):
+                content.move_focus(delta)
+
+    def _get_page_rows(self):
+        """Get the number of list rows shown per page"""
+        if self.main_loop is not None:
+            # The main loop caches the screen size and resets it on resize,
+            # so reuse it rather than querying the terminal per keypress
+            screen_size = self.main_loop.screen_size
+            if not screen_size:
+                screen_size = self.main_loop.screen.get_cols_rows()
+            _, screen_rows = screen_size
+        else:
+            screen_rows = self.DEFAULT_TERMINAL_HEIGHT
 
-        # Handle different navigation keys
-        terminal_size = (self.DEFAULT_TERMINAL_WIDTH, self.DEFAULT_TERMINAL_HEIGHT)
-        if key == "j":
-            # Move down one line
-            focused_widget.keypress(terminal_size, "down")
-        elif key == "k":
-            # Move up one line
-            focused_widget.keypress(terminal_size, "up")
-        elif key == "J":
-            # Page down
-            focused_widget.keypress(terminal_size, "page down")
-        elif key == "K":
-            # Page up
-            focused_widget.keypress(terminal_size, "page up")
+        # Frame header and footer, plus the list's own column header
+        chrome_rows = len(self._header.contents) + 1 + self.HEADER_ROWS
+        return max(screen_rows - chrome_rows, 1)
 
     def _handle_module_selection(self):
         """Handle module selection in modules view"""
         if not self.module_listbox or not self.module_list:
             return
 
-        # Get current focus position
-        _, focus_pos = self.module_listbox.get_focus()
+        # Focus positions are module list indices
+        focus_pos = self.module_listbox.focus_position
 
-        # Skip header and divider
-        if focus_pos >= self.HEADER_ROWS:
-            module_index = focus_pos - self.HEADER_ROWS
-            if module_index < len(self.module_list):
-                selected_mod = self.module_list[module_index]
-                self._apply_filter(selected_mod["name"])
-                self.current_view = "blocks"
+        if focus_pos < len(self.module_list):
+            selected_mod = self.module_list[focus_pos]
+            self._apply_filter(selected_mod["name"])
+            self.current_view = "blocks"
 
     def _toggle_block_sort(self):
         """Toggle between sorting blocks by address and hits"""
@@ -572,7 +864,7 @@ class CoverageInspector:
         else:
             self.block_sort_mode = "address"
 
-        self._refresh_block_list()
+        self._sort_block_list()
         self._update_view()
         self._update_header_footer()
 
@@ -584,6 +876,7 @@ class CoverageInspector:
         self.size_filter = None
         self.search_term = ""
         self.filtered_coverage = self.coverage
+        self._filter_generation += 1  # discard any filter still running
 
         self._refresh_module_list()
         self._refresh_block_list()
@@ -638,6 +931,7 @@ class CoverageInspector:
             self.main_loop = urwid.MainLoop(
                 self.main_widget, palette, unhandled_input=self._handle_input
             )
+            self._filter_pipe = self.main_loop.watch_pipe(self._on_filter_done)
             self.main_loop.run()
 
         except KeyboardInterrupt:
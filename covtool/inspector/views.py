@@ -1,7 +1,22 @@
 """View creation and formatting utilities for the coverage inspector TUI"""
 
 import os
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+
 import urwid
+from urwid.str_util import calc_text_pos
+
+# Hit count distribution ranges, by inclusive upper bound
+HIT_RANGE_BOUNDS = (1, 10, 100, 1000)
+HIT_RANGE_NAMES = ("1 hit", "2-10 hits", "11-100 hits", "101-1000 hits", "1000+ hits")
+
+
+@lru_cache(maxsize=4096)
+def _basename(path):
+    """Memoized os.path.basename; the same few module paths recur on every refresh"""
+    return os.path.basename(path)
 
 
 class SelectableText(urwid.Text):
@@ -18,12 +33,189 @@ class SelectableText(urwid.Text):
         return key
 
 
+class ModuleListWalker(urwid.ListWalker):
+    """List walker that renders module rows on demand from the inspector's module list
+
+    Positions are module list indices; the column header sits above the list
+    box, so position 0 is always the first module.
+    """
+
+    def __init__(self, view_creator):
+        self.view_creator = view_creator
+        self.focus = 0
+        self._rows = {}  # module lists are small, so every rendered row is kept
+
+    def __len__(self):
+        return len(self.view_creator.inspector.module_list)
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+
+        widget = self._rows.get(position)
+        if widget is None:
+            mod_info = self.view_creator.inspector.module_list[position]
+            item = SelectableText(mod_info["line"], index=position)
+            widget = self._rows[position] = urwid.AttrMap(
+                item, None, focus_map="selected"
+            )
+        return widget
+
+    def next_position(self, position):
+        if position + 1 >= len(self):
+            raise IndexError(position + 1)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position - 1)
+        return position - 1
+
+    def set_focus(self, position):
+        self.focus = position
+        self._modified()
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self) - 1, -1, -1)
+        return range(len(self))
+
+
+class BlockListView(urwid.Widget):
+    """Box widget that draws the visible slice of the block list as one canvas
+
+    Block lines come preformatted from the inspector, so a frame costs a
+    single TextCanvas for the rows on screen rather than a Text widget (and
+    its text layout) per visible row.
+    """
+
+    _sizing = frozenset([urwid.Sizing.BOX])
+    _selectable = True
+
+    # Rows scrolled per mouse wheel step
+    WHEEL_ROWS = 3
+
+    def __init__(self, inspector, header_text):
+        super().__init__()
+        self.inspector = inspector
+        self.header_text = header_text
+        self.focus_index = 0  # index into the inspector's block list
+        self.top = 0  # block list index shown on the first row
+
+    def __len__(self):
+        return len(self.inspector.block_list)
+
+    def _page_rows(self, size):
+        """Number of block rows that fit below the column header"""
+        _, maxrow = size
+        return max(maxrow - self.inspector.HEADER_ROWS, 1)
+
+    def _scroll_to_focus(self, rows):
+        """Adjust the top row so the focused block is on screen"""
+        if self.focus_index < self.top:
+            self.top = self.focus_index
+        elif self.focus_index >= self.top + rows:
+            self.top = self.focus_index - rows + 1
+        self.top = max(min(self.top, len(self) - rows), 0)
+
+    def render(self, size, focus=False):
+        maxcol, maxrow = size
+        rows = self._page_rows(size)
+        self._scroll_to_focus(rows)
+
+        end = min(self.top + rows, len(self))
+        lines = [self.header_text, "═" * maxcol]
+        lines.extend(self.inspector._get_block_line(i) for i in range(self.top, end))
+        lines.extend([""] * (maxrow - len(lines)))
+
+        focus_row = self.focus_index - self.top + self.inspector.HEADER_ROWS
+        text = []
+        charsets = []
+        attrs = []
+        for row, line in enumerate(lines[:maxrow]):
+            encoded, cs = urwid.util.apply_target_encoding(_fit_line(line, maxcol))
+            text.append(encoded)
+            charsets.append(cs)
+            if row == 0:
+                attrs.append([("header", len(encoded))])
+            elif focus and row == focus_row:
+                attrs.append([("focus", len(encoded))])
+            else:
+                attrs.append([])
+
+        return urwid.TextCanvas(text, attrs, charsets, maxcol=maxcol, check_width=False)
+
+    def keypress(self, size, key):
+        rows = self._page_rows(size)
+        moves = {"up": -1, "down": 1, "page up": -rows, "page down": rows}
+
+        if key in moves:
+            if key in ("page up", "page down"):
+                self.top += moves[key]
+            self.move_focus(moves[key])
+        elif key == "home":
+            self.move_focus(-len(self))
+        elif key == "end":
+            self.move_focus(len(self))
+        else:
+            return key
+        return None
+
+    def move_focus(self, delta):
+        """Move the focus by delta rows, clamped to the block list"""
+        self.focus_index = max(min(self.focus_index + delta, len(self) - 1), 0)
+        self._invalidate()
+
+    def mouse_event(self, size, event, button, col, row, focus):
+        if button == 4:
+            for _ in range(self.WHEEL_ROWS):
+                self.keypress(size, "up")
+            return True
+        if button == 5:
+            for _ in range(self.WHEEL_ROWS):
+                self.keypress(size, "down")
+            return True
+        if event == "mouse press" and button == 1:
+            position = self.top + row - self.inspector.HEADER_ROWS
+            if row >= self.inspector.HEADER_ROWS and position < len(self):
+                self.focus_index = position
+                self._invalidate()
+            return True
+        return False
+
+
+def _fit_line(line, maxcol):
+    """Clip or pad a line to exactly maxcol screen columns"""
+    if line.isascii():
+        return line[:maxcol].ljust(maxcol)
+    pos, width = calc_text_pos(line, 0, len(line), maxcol)
+    return line[:pos] + " " * (maxcol - width)
+
+
 class ViewCreator:
     """Handles creation of all views for the coverage inspector"""
 
     def __init__(self, inspector):
         self.inspector = inspector
 
+        # Row layouts with the column widths filled in once, as bound
+        # str.format templates reused for every row
+        self._module_row_format_hits = (
+            f"{{:<{inspector.MODULE_WIDTH_WITH_HITS}}} {{:<8,}} {{:<10}} {{:<8}} {{:<10}}"
+        ).format
+        self._module_row_format_no_hits = (
+            f"{{:<{inspector.MODULE_WIDTH_NO_HITS}}} {{:<10,}} {{:<12}} {{:<8}}"
+        ).format
+        self._block_row_format = (
+            f"{{:<{inspector.BLOCK_MODULE_WIDTH}}} 0x{{:08x}} "
+            f"{{:<{inspector.ADDRESS_FIELD_WIDTH}}} {{:<{inspector.SIZE_FIELD_WIDTH}}} "
+            f"{{:<{inspector.HITS_FIELD_WIDTH}}}"
+        ).format
+
+        # (coverage, widgets) for the stats sections that depend only on the
+        # filtered coverage, reused while search and block filters change
+        self._coverage_stats = None
+
     def create_modules_view(self):
         """Create the modules view with proper navigation"""
         if not self.inspector.module_list:
@@ -31,19 +223,12 @@ class ViewCreator:
                 urwid.Text("No modules found", align="center"), valign="middle"
             )
 
-        items = []
-        items.extend(self._create_module_header())
-        items.extend(self._create_module_entries())
-
-        self.inspector.module_listbox = urwid.ListBox(
-            urwid.SimpleFocusListWalker(items)
-        )
+        # Rows are rendered by the walker as they scroll into view; the column
+        # header stays fixed above them
+        self.inspector.module_listbox = urwid.ListBox(ModuleListWalker(self))
+        header = urwid.Pile(self._create_module_header())
 
-        # Set focus to first module (skip header and divider)
-        if len(items) > self.inspector.HEADER_ROWS:
-            self.inspector.module_listbox.set_focus(self.inspector.HEADER_ROWS)
-
-        return self.inspector.module_listbox
+        return urwid.Frame(self.inspector.module_listbox, header=header)
 
     def _create_module_header(self):
         """Create header for module view"""
@@ -55,39 +240,34 @@ class ViewCreator:
         header = urwid.AttrMap(urwid.Text(header_text), "header")
         return [header, urwid.Divider("═")]
 
-    def _create_module_entries(self):
-        """Create module entry rows"""
-        items = []
-        for i, mod_info in enumerate(self.inspector.module_list):
-            line_text = self._format_module_line(mod_info)
-            item = SelectableText(line_text, index=i)
-            item = urwid.AttrMap(item, None, focus_map="selected")
-            items.append(item)
-        return items
-
-    def _format_module_line(self, mod_info):
+    def _format_module_line(self, mod_info, has_hits=None):
         """Format a single module line for display"""
-        mod_name = self.inspector._truncate_module_name(mod_info["name"])
+        if has_hits is None:
+            has_hits = self.inspector.filtered_coverage.data.has_hit_counts()
+
+        mod_name = self.inspector._truncate_module_name(mod_info["name"], has_hits)
         size_str = self.inspector._format_size(mod_info["size"])
 
-        if self.inspector.filtered_coverage.data.has_hit_counts():
+        percentage_str = f"{mod_info['percentage']:.1f}%"
+
+        if has_hits:
             hits_str = self.inspector._format_hit_count(mod_info["hits"])
-            percentage_str = f"{mod_info['percentage']:.1f}%"
-            return f"{mod_name:<{self.inspector.MODULE_WIDTH_WITH_HITS}} {mod_info['count']:<8,} {size_str:<10} {percentage_str:<8} {hits_str:<10}"
+            return self._module_row_format_hits(
+                mod_name, mod_info["count"], size_str, percentage_str, hits_str
+            )
         else:
-            percentage_str = f"{mod_info['percentage']:.1f}%"
-            return f"{mod_name:<{self.inspector.MODULE_WIDTH_NO_HITS}} {mod_info['count']:<10,} {size_str:<12} {percentage_str:<8}"
+            return self._module_row_format_no_hits(
+                mod_name, mod_info["count"], size_str, percentage_str
+            )
 
     def create_blocks_view(self):
         """Create the blocks view with scrolling"""
+        self.inspector._ensure_block_list()
         if not self.inspector.block_list:
             return urwid.Filler(
                 urwid.Text("No blocks found", align="center"), valign="middle"
             )
 
-        # Create block list items
-        items = []
-
         # Header with hits column and sort indicator
         sort_indicator = " ↓" if self.inspector.block_sort_mode == "hits" else " ↑"
         hit_col_header = (
@@ -102,59 +282,44 @@ class ViewCreator:
         )
 
         header_text = f"{'Module':<{self.inspector.BLOCK_MODULE_WIDTH}} {addr_col_header:<{self.inspector.OFFSET_FIELD_WIDTH}} {'Address':<{self.inspector.ADDRESS_FIELD_WIDTH}} {'Size':<{self.inspector.SIZE_FIELD_WIDTH}} {hit_col_header:<{self.inspector.HITS_FIELD_WIDTH}}"
-        header = urwid.AttrMap(urwid.Text(header_text), "header")
-        items.append(header)
-        items.append(urwid.Divider("═"))
+        # Only the rows on screen are drawn, straight from the block lines
+        return BlockListView(self.inspector, header_text)
 
-        # Block entries (show more blocks, with pagination)
-        max_blocks = min(
-            self.inspector.MAX_BLOCKS_DISPLAY, len(self.inspector.block_list)
-        )
-        for block_info in self.inspector.block_list[:max_blocks]:
-            block = block_info["block"]
-            abs_addr_str = (
-                f"0x{block_info['abs_addr']:x}" if block_info["abs_addr"] else "unknown"
-            )
+    def _format_block_line(self, block, module_name, abs_addr, hits):
+        """Format a single block line for display"""
+        abs_addr_str = f"0x{abs_addr:x}" if abs_addr else "unknown"
 
-            mod_name = block_info["module_name"]
-
-            hits_str = self.inspector._format_hit_count(block_info["hits"])
-            mod_name = self.inspector._truncate_module_name(
-                mod_name, has_hits=False
-            )  # blocks view doesn't depend on hit count presence
-
-            line_text = f"{mod_name:<{self.inspector.BLOCK_MODULE_WIDTH}} 0x{block.start:08x} {abs_addr_str:<{self.inspector.ADDRESS_FIELD_WIDTH}} {block.size:<{self.inspector.SIZE_FIELD_WIDTH}} {hits_str:<{self.inspector.HITS_FIELD_WIDTH}}"
-            item = SelectableText(line_text)
-            item = urwid.AttrMap(item, None, focus_map="focus")
-            items.append(item)
-
-        if len(self.inspector.block_list) > max_blocks:
-            remaining = len(self.inspector.block_list) - max_blocks
-            items.append(
-                urwid.AttrMap(
-                    urwid.Text(
-                        f"... ({remaining:,} more blocks - use filter to narrow down)"
-                    ),
-                    "dim",
-                )
-            )
+        hits_str = self.inspector._format_hit_count(hits)
+        mod_name = self.inspector._truncate_module_name(
+            module_name, has_hits=False
+        )  # blocks view doesn't depend on hit count presence
 
-        listbox = urwid.ListBox(urwid.SimpleFocusListWalker(items))
-        return listbox
+        return self._block_row_format(
+            mod_name, block.start, abs_addr_str, block.size, hits_str
+        )
 
     def create_stats_view(self):
         """Create an enhanced stats view"""
         stats_content = []
 
         stats_content.extend(self._create_stats_title())
-        stats_content.extend(self._create_basic_stats())
-        stats_content.extend(self._create_address_space_stats())
-        stats_content.extend(self._create_hit_distribution_stats())
+        stats_content.extend(self._get_coverage_stats())
         stats_content.extend(self._create_top_modules_stats())
 
         pile = urwid.Pile(stats_content)
         return urwid.Filler(pile, valign="top")
 
+    def _get_coverage_stats(self):
+        """Get the basic, address space and hit distribution sections"""
+        cov = self.inspector.filtered_coverage
+        if self._coverage_stats is None or self._coverage_stats[0] is not cov:
+            content = []
+            content.extend(self._create_basic_stats())
+            content.extend(self._create_address_space_stats())
+            content.extend(self._create_hit_distribution_stats())
+            self._coverage_stats = (cov, content)
+        return self._coverage_stats[1]
+
     def _create_stats_title(self):
         """Create stats view title section"""
         title_text = (
@@ -170,15 +335,17 @@ class ViewCreator:
     def _create_basic_stats(self):
         """Create basic statistics section"""
         cov = self.inspector.filtered_coverage
+        block_count = len(cov)
+        has_hits = cov.data.has_hit_counts()
         basic_stats = [
-            f"Total basic blocks: {len(cov):,}",
+            f"Total basic blocks: {block_count:,}",
             f"Total modules: {len(cov.modules):,}",
-            f"Hit count support: {'Yes' if cov.data.has_hit_counts() else 'No (defaults to 1)'}",
+            f"Hit count support: {'Yes' if has_hits else 'No (defaults to 1)'}",
         ]
 
-        if cov.data.basic_blocks:
+        if block_count:
             basic_stats.extend(self._get_size_stats())
-            if cov.data.has_hit_counts():
+            if has_hits:
                 basic_stats.extend(self._get_hit_count_stats())
 
         content = [urwid.Text(f"  {stat}") for stat in basic_stats]
@@ -188,10 +355,12 @@ class ViewCreator:
     def _get_size_stats(self):
         """Get size-related statistics"""
         cov = self.inspector.filtered_coverage
-        total_size = sum(block.size for block in cov.data.basic_blocks)
-        avg_size = total_size / len(cov.data.basic_blocks)
-        min_size = min(block.size for block in cov.data.basic_blocks)
-        max_size = max(block.size for block in cov.data.basic_blocks)
+        # Gather the sizes once; the reductions then run in C over a flat list
+        sizes = [block.size for block in cov.data.basic_blocks]
+        total_size = sum(sizes)
+        avg_size = total_size / len(sizes)
+        min_size = min(sizes)
+        max_size = max(sizes)
 
         total_size_str = self.inspector._format_size(total_size).replace(" B", " bytes")
 
@@ -219,23 +388,19 @@ class ViewCreator:
         """Create address space statistics section"""
         cov = self.inspector.filtered_coverage
 
-        if cov.data.basic_blocks:
-            addresses = cov.get_absolute_addresses()
-            if addresses:
-                min_addr = min(addresses)
-                max_addr = max(addresses)
-                addr_range = max_addr - min_addr
-
-                return [
-                    urwid.AttrMap(
-                        urwid.Text("Address Space", align="center"), "subtitle"
-                    ),
-                    urwid.Text(f"  Range: 0x{min_addr:x} - 0x{max_addr:x}"),
-                    urwid.Text(
-                        f"  Span: {addr_range:,} bytes ({addr_range / 1024 / 1024:.1f} MB)"
-                    ),
-                    urwid.Divider(),
-                ]
+        address_range = cov.get_address_range()
+        if address_range:
+            min_addr, max_addr = address_range
+            addr_range = max_addr - min_addr
+
+            return [
+                urwid.AttrMap(urwid.Text("Address Space", align="center"), "subtitle"),
+                urwid.Text(f"  Range: 0x{min_addr:x} - 0x{max_addr:x}"),
+                urwid.Text(
+                    f"  Span: {addr_range:,} bytes ({addr_range / 1024 / 1024:.1f} MB)"
+                ),
+                urwid.Divider(),
+            ]
         return []
 
     def _create_hit_distribution_stats(self):
@@ -245,13 +410,15 @@ class ViewCreator:
             return []
 
         hit_counts = cov.data.hit_counts
-        hit_ranges = {
-            "1 hit": sum(1 for h in hit_counts if h == 1),
-            "2-10 hits": sum(1 for h in hit_counts if 2 <= h <= 10),
-            "11-100 hits": sum(1 for h in hit_counts if 11 <= h <= 100),
-            "101-1000 hits": sum(1 for h in hit_counts if 101 <= h <= 1000),
-            "1000+ hits": sum(1 for h in hit_counts if h > 1000),
-        }
+        hit_ranges = dict.fromkeys(HIT_RANGE_NAMES, 0)
+
+        # Tally each distinct hit count in one C-level pass, then bucket the
+        # distinct values rather than rescanning every block per range
+        for hits, count in Counter(hit_counts).items():
+            if hits >= 1:
+                hit_ranges[
+                    HIT_RANGE_NAMES[bisect_left(HIT_RANGE_BOUNDS, hits)]
+                ] += count
 
         content = [
             urwid.AttrMap(
@@ -282,7 +449,7 @@ class ViewCreator:
         ]
 
         for i, mod_info in enumerate(self.inspector.module_list[:5]):
-            mod_name = os.path.basename(mod_info["name"])
+            mod_name = _basename(mod_info["name"])
             mod_name = self.inspector._truncate_module_name(mod_name, has_hits=False)
             content.append(
                 urwid.Text(f"  {i+1}. {mod_name} ({mod_info['percentage']:.1f}%)")
@@ -120,6 +120,33 @@ class TestCoverageSet:
         
         assert addresses == expected
 
+    def test_absolute_address_array(self):
+        """test absolute addresses as a compact array"""
+        cov = self.create_test_coverage()
+        addresses = cov.get_absolute_address_array()
+
+        assert addresses.typecode == "Q"
+        assert sorted(addresses) == [0x401000, 0x402000, 0x7fff00050000]
+
+    def test_address_range(self):
+        """test the absolute address range is computed once"""
+        cov = self.create_test_coverage()
+
+        assert cov.get_address_range() == (0x401000, 0x7fff00050000)
+        assert cov.get_address_range() is cov.get_address_range()
+        assert cov.filter_by_module("nonexistent").get_address_range() is None
+
+    def test_module_stats(self):
+        """test per-module block, byte and hit totals are computed once"""
+        cov = self.create_test_coverage()
+        stats = cov.get_module_stats()
+
+        assert stats == {
+            "program@0x400000": (2, 48, 2),
+            "libc.so@0x7fff00000000": (1, 8, 1),
+        }
+        assert cov.get_module_stats() is stats
+
     def test_rarity_analysis(self):
         """test rarity analysis across multiple coverage sets"""
         cov1 = self.create_test_coverage("rare1")
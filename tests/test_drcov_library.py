@@ -1,11 +1,14 @@
 """tests for the new drcov library functionality"""
 
+import os
 import tempfile
+import threading
 import pytest
 from io import BytesIO, StringIO
 
+from covtool import drcov
 from covtool.drcov import (
-    read, write, builder,
+    read, read_arrays, read_modules, read_summary, write, builder,
     CoverageData, BasicBlock, ModuleEntry, FileHeader,
     ModuleTableVersion, DrCovError, CoverageBuilder
 )
@@ -73,6 +76,66 @@ class TestDrcovBasics:
         assert stats[0] == 2  # 2 blocks in module 0
         assert stats[1] == 1  # 1 block in module 1
 
+    def test_find_module_non_sequential_ids(self):
+        """test find_module with gapped ids that are later renumbered"""
+        coverage = CoverageData(
+            header=FileHeader(),
+            modules=[
+                ModuleEntry(5, 0x400000, 0x500000, "/bin/test"),
+                ModuleEntry(9, 0x600000, 0x700000, "/lib/libc.so"),
+            ],
+            basic_blocks=[],
+            module_version=ModuleTableVersion.V2,
+        )
+
+        assert coverage.find_module(9).path == "/lib/libc.so"
+        assert coverage.find_module(7) is None
+
+        coverage.modules[1].id = 7
+        assert coverage.find_module(7).path == "/lib/libc.so"
+        assert coverage.find_module(9) is None
+
+    def test_modules_by_id_first_entry_wins(self):
+        """test the id map resolves duplicate ids like find_module"""
+        coverage = CoverageData(
+            header=FileHeader(),
+            modules=[
+                ModuleEntry(5, 0x400000, 0x500000, "/bin/test"),
+                ModuleEntry(9, 0x600000, 0x700000, "/lib/libc.so"),
+                ModuleEntry(5, 0x800000, 0x900000, "/lib/libm.so"),
+            ],
+            basic_blocks=[],
+            module_version=ModuleTableVersion.V2,
+        )
+
+        by_id = coverage.modules_by_id()
+
+        assert sorted(by_id) == [5, 9]
+        assert by_id[5] is coverage.find_module(5)
+        assert by_id[5].path == "/bin/test"
+
+    def test_find_module_after_in_place_changes(self):
+        """test find_module sees modules removed or replaced in the same list"""
+        coverage = CoverageData(
+            header=FileHeader(),
+            modules=[
+                ModuleEntry(5, 0x400000, 0x500000, "/bin/test"),
+                ModuleEntry(9, 0x600000, 0x700000, "/lib/libc.so"),
+            ],
+            basic_blocks=[],
+            module_version=ModuleTableVersion.V2,
+        )
+        assert coverage.find_module(9).path == "/lib/libc.so"
+
+        # replaced with a new entry carrying the same id
+        coverage.modules[1] = ModuleEntry(9, 0x800000, 0x900000, "/lib/libm.so")
+        assert coverage.find_module(9).path == "/lib/libm.so"
+
+        # removed from the table
+        coverage.modules.pop()
+        assert coverage.find_module(9) is None
+        assert coverage.find_module(5).path == "/bin/test"
+
 
 class TestDrcovIO:
     """test reading and writing drcov files"""
@@ -120,6 +183,193 @@ class TestDrcovIO:
             assert orig_bb.size == reload_bb.size
             assert orig_bb.module_id == reload_bb.module_id
 
+    def test_stream_write_and_read_cycle(self):
+        """test writing to and reading from an in-memory binary stream"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        b.add_coverage(0, 0x2000, 16, hit_count=3)
+        original = b.build()
+
+        stream = BytesIO()
+        write(original, stream)
+        stream.seek(0)
+        reloaded = read(stream)
+
+        assert reloaded.basic_blocks == original.basic_blocks
+        assert reloaded.hit_counts == [7, 3]
+
+    def test_hit_count_table_written_as_bytes(self):
+        """test every chunk handed to the sink is byte-like with a byte length"""
+
+        class CheckingSink(BytesIO):
+            def writelines(self, lines):
+                for line in lines:
+                    assert len(line) == memoryview(line).nbytes
+                    self.write(line)
+
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        b.add_coverage(0, 0x2000, 16, hit_count=3)
+
+        stream = CheckingSink()
+        write(b.build(), stream)
+        stream.seek(0)
+
+        assert read(stream).hit_counts == [7, 3]
+
+    def test_unsupported_hit_count_table_version(self):
+        """test hit count tables with an unknown version are rejected"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        stream = BytesIO()
+        write(b.build(), stream)
+        data = stream.getvalue().replace(
+            b"Hit Count Table: version 1", b"Hit Count Table: version 7"
+        )
+
+        offset = data.index(b"Hit Count Table:")
+        with pytest.raises(DrCovError, match="version: 7"):
+            drcov._Parser._parse_hit_count_table(data, 1, offset)
+
+        # Reading still succeeds, skipping the table. This is a deliberate
+        # change for files on disk: the old binary-mode path decoded any
+        # version as v1, while the old text-stream path already skipped
+        # unknown versions. Every path now skips them, permissive or not.
+        reloaded = read(BytesIO(data))
+        assert len(reloaded.basic_blocks) == 1
+        assert reloaded.hit_counts is None
+        assert read(BytesIO(data), permissive=True).hit_counts is None
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+    def test_read_from_fifo(self):
+        """test reading a path that is a pipe rather than a regular file"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        b.add_coverage(0, 0x2000, 16, hit_count=3)
+        original = b.build()
+        stream = BytesIO()
+        write(original, stream)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.drcov")
+            os.mkfifo(path)
+
+            def feed():
+                with open(path, "wb") as fifo:
+                    fifo.write(stream.getvalue())
+
+            writer = threading.Thread(target=feed, daemon=True)
+            writer.start()
+            reloaded = read(path)
+            writer.join(5)
+
+        assert reloaded.basic_blocks == original.basic_blocks
+        assert reloaded.hit_counts == [7, 3]
+
+    def test_gzip_write_and_read_cycle(self):
+        """test transparent compression for .gz paths"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        b.add_coverage(0, 0x2000, 16, hit_count=3)
+        original = b.build()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/trace.drcov.gz"
+            write(original, path)
+
+            with open(path, "rb") as f:
+                assert f.read(2) == b"\x1f\x8b"  # gzip magic
+
+            reloaded = read(path)
+
+        assert reloaded.basic_blocks == original.basic_blocks
+        assert reloaded.hit_counts == [7, 3]
+
+    def test_read_modules_only(self, monkeypatch):
+        """test reading the module table without the binary tables"""
+        b = builder()
+        b.set_flavor("modules_only")
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_module("/lib/libc.so.6", 0x7fff00000000, 0x7fff00100000)
+        b.add_coverage(0, 0x1000, 32)
+        b.add_coverage(1, 0x2000, 16, hit_count=5)
+        stream = BytesIO()
+        write(b.build(), stream)
+
+        # tiny chunks so the BB table marker straddles chunk boundaries
+        monkeypatch.setattr(drcov, "_READ_CHUNK_SIZE", 3)
+        stream.seek(0)
+        header, modules, module_version, block_count = read_modules(stream)
+
+        assert header.flavor == "modules_only"
+        assert [m.path for m in modules] == ["/bin/program", "/lib/libc.so.6"]
+        assert module_version == ModuleTableVersion.V2
+        assert block_count == 2
+
+    def test_read_summary(self):
+        """test per-module totals read without materializing blocks"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_module("/lib/libc.so.6", 0x7fff00000000, 0x7fff00100000)
+        b.add_module("/lib/unused.so", 0x7ffe00000000, 0x7ffe00100000)
+        b.add_coverage(0, 0x1000, 32)
+        b.add_coverage(1, 0x2000, 16)
+        b.add_coverage(0, 0x3000, 8)
+        original = b.build()
+        stream = BytesIO()
+        write(original, stream)
+
+        stream.seek(0)
+        summary = read_summary(stream)
+
+        assert summary.blocks_by_module == {0: 2, 1: 1}
+        assert summary.bytes_by_module == {0: 40, 1: 16}
+        assert summary.total_blocks == 3
+        assert summary.total_bytes == 56
+        assert summary == original.summarize()
+
+    def test_read_summary_invalid_module_id(self):
+        """test that summaries validate block module ids like read()"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_basic_blocks([BasicBlock(0x1000, 32, 0), BasicBlock(0x2000, 16, 7)])
+        stream = BytesIO()
+        write(b.data(), stream, validate=False)
+
+        stream.seek(0)
+        with pytest.raises(DrCovError):
+            read_summary(stream)
+
+        stream.seek(0)
+        summary = read_summary(stream, permissive=True)
+        assert summary.blocks_by_module == {0: 1}
+        assert summary.bytes_by_module == {0: 32}
+
+    def test_read_arrays(self):
+        """test reading basic blocks as typed columns"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_module("/lib/libc.so.6", 0x7fff00000000, 0x7fff00100000)
+        b.add_coverage(0, 0x1000, 32, hit_count=7)
+        b.add_coverage(1, 0xFFFFFFF0, 16, hit_count=3)
+        original = b.build()
+        stream = BytesIO()
+        write(original, stream)
+
+        stream.seek(0)
+        arrays = read_arrays(stream)
+
+        assert [m.path for m in arrays.modules] == ["/bin/program", "/lib/libc.so.6"]
+        assert list(arrays.starts) == [0x1000, 0xFFFFFFF0]
+        assert list(arrays.sizes) == [32, 16]
+        assert list(arrays.module_ids) == [0, 1]
+        assert list(arrays.hit_counts) == [7, 3]
+
     def test_empty_coverage(self):
         """test handling empty coverage data"""
         b = builder()
@@ -169,6 +419,28 @@ class TestModuleTableVersions:
         
         assert coverage.module_version == ModuleTableVersion.LEGACY
 
+    def test_v4_windows_fields_round_trip(self):
+        """test module table version 4 with checksum/timestamp columns"""
+        b = builder()
+        b.set_module_version(ModuleTableVersion.V4)
+        b.add_module("/bin/test, with comma", 0x400000, 0x500000, 0x401000)
+        module = b.data().modules[0]
+        module.checksum = 0x1234
+        module.timestamp = 0x5678
+
+        stream = BytesIO()
+        write(b.build(), stream)
+        stream.seek(0)
+        reloaded = read(stream).modules[0]
+
+        assert reloaded.path == "/bin/test, with comma"
+        assert reloaded.base == 0x400000
+        assert reloaded.entry == 0x401000
+        assert reloaded.containing_id == -1
+        assert reloaded.offset == 0
+        assert reloaded.checksum == 0x1234
+        assert reloaded.timestamp == 0x5678
+
 
 class TestCoverageBuilder:
     """test coverage builder functionality"""
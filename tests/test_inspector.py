@@ -0,0 +1,459 @@
+"""tests for the coverage inspector tui data and views"""
+
+import contextlib
+import os
+import threading
+import types
+
+import urwid
+
+from covtool.core import CoverageSet
+from covtool.drcov import builder
+from covtool.inspector.inspector import CoverageInspector
+
+SCREEN = (100, 10)
+
+
+class TestInspectorViews:
+    """test inspector views without running the main loop"""
+
+    def create_inspector(self, block_count=3, hit_counts=False):
+        """helper to create an inspector over synthetic coverage"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        b.add_module("/lib/libc.so", 0x7fff00000000, 0x7fff00100000)
+        for i in range(block_count):
+            b.add_coverage(i % 2, 0x1000 + i * 16, 16, hit_count=i + 1 if hit_counts else 1)
+        inspector = CoverageInspector(CoverageSet(b.build()), "test.drcov")
+        return self.attach_screen(inspector)
+
+    def attach_screen(self, inspector):
+        """helper to build the frame and initial view run() would, minus the loop"""
+        inspector.content_area = urwid.WidgetPlaceholder(urwid.Text(""))
+        inspector.main_widget = urwid.Frame(
+            inspector.content_area,
+            header=inspector._create_header(),
+            footer=inspector._create_footer(),
+        )
+        inspector._update_view()
+        return inspector
+
+    @contextlib.contextmanager
+    def filter_pipe(self, inspector):
+        """helper to run filters on worker threads, yielding the pipe's read end"""
+        read_fd, inspector._filter_pipe = os.pipe()
+        try:
+            yield read_fd
+        finally:
+            os.close(read_fd)
+            os.close(inspector._filter_pipe)
+
+    def test_blocks_view_lists_every_block(self):
+        """test the blocks view is not capped and draws only the visible rows"""
+        inspector = self.create_inspector(block_count=12000)
+        view = inspector.view_creator.create_blocks_view()
+
+        assert len(view) == 12000
+
+        view.render(SCREEN, focus=True)
+        view.keypress(SCREEN, "end")
+        canvas = view.render(SCREEN, focus=True)
+
+        last_line = canvas.text[-1].decode()
+        assert "0x0002fdf0" in last_line  # offset of the final block
+        assert inspector._block_lines.count(None) > 11000
+
+    def test_blocks_view_starts_at_header(self):
+        """test the first rendered lines are the column header"""
+        inspector = self.create_inspector()
+        view = inspector.view_creator.create_blocks_view()
+
+        lines = [line.decode() for line in view.render(SCREEN).text]
+
+        assert lines[0].startswith("Module")
+        assert "program" in lines[2]
+        assert len(lines) == SCREEN[1]
+
+    def test_blocks_view_navigation(self):
+        """test moving the focus scrolls the view and highlights the row"""
+        inspector = self.create_inspector(block_count=50)
+        view = inspector.view_creator.create_blocks_view()
+        rows = SCREEN[1] - inspector.HEADER_ROWS
+
+        view.keypress(SCREEN, "page down")
+        view.keypress(SCREEN, "down")
+        canvas = view.render(SCREEN, focus=True)
+
+        assert view.focus_index == rows + 1
+        assert view.top <= view.focus_index < view.top + rows
+        focus_row = view.focus_index - view.top + inspector.HEADER_ROWS
+        assert canvas._attr[focus_row][0][0] == "focus"
+
+        assert view.keypress(SCREEN, "x") == "x"
+        view.keypress(SCREEN, "home")
+        view.render(SCREEN, focus=True)
+        assert (view.focus_index, view.top) == (0, 0)
+
+    def test_views_reused_until_lists_change(self):
+        """test switching views reuses built widgets until a refresh"""
+        inspector = self.create_inspector()
+
+        inspector.current_view = "blocks"
+        inspector._update_view()
+        blocks_view = inspector.content_area.original_widget
+
+        inspector.current_view = "stats"
+        inspector._update_view()
+        inspector.current_view = "blocks"
+        inspector._update_view()
+        assert inspector.content_area.original_widget is blocks_view
+
+        inspector.block_sort_mode = "hits"
+        inspector._refresh_block_list()
+        inspector._update_view()
+        assert inspector.content_area.original_widget is not blocks_view
+
+    def test_toggle_sort_reorders_built_blocks(self):
+        """test toggling the sort mode reorders without rebuilding the columns"""
+        inspector = self.create_inspector(block_count=6, hit_counts=True)
+        inspector._ensure_block_list()
+        rows = inspector._block_rows
+
+        inspector._toggle_block_sort()
+
+        hits = [inspector._get_block_row(i)[3] for i in range(len(inspector.block_list))]
+        assert hits == [6, 5, 4, 3, 2, 1]
+        assert inspector._block_rows is rows
+
+        inspector._toggle_block_sort()
+
+        blocks = [inspector._get_block_row(i)[0] for i in range(6)]
+        keys = [(block.module_id, block.start) for block in blocks]
+        assert keys == sorted(keys)
+
+    def test_block_row_resolves_module(self):
+        """test block rows carry the module name and absolute address"""
+        inspector = self.create_inspector()
+        inspector._ensure_block_list()
+
+        block, module_name, abs_addr, hits = inspector._get_block_row(0)
+
+        assert module_name == "program"
+        assert abs_addr == 0x400000 + block.start
+        assert hits == 1
+
+    def test_hitcount_filter_selects_exact_matches(self):
+        """test the exact hit count filter keeps only matching blocks"""
+        inspector = self.create_inspector(block_count=6, hit_counts=True)
+
+        inspector._ensure_block_list()
+        rows = inspector._block_rows
+
+        inspector.hitcount_filter = 4
+        inspector._refresh_hitcount_filter()
+        inspector._ensure_block_list()
+
+        assert len(inspector.block_list) == 1
+        block, _, _, hits = inspector._get_block_row(0)
+        assert (block.start, hits) == (0x1030, 4)
+        assert inspector._block_rows is rows  # columns reused, not rebuilt
+
+    def test_format_size_units(self):
+        """test size formatting picks units and memoizes results"""
+        inspector = self.create_inspector()
+
+        assert inspector._format_size(512) == "512 B"
+        assert inspector._format_size(2048) == "2.0 KB"
+        assert inspector._format_size(3 * 1024 * 1024) == "3.0 MB"
+        assert inspector._format_size.cache_info().currsize >= 3
+
+    def test_block_lines_kept_across_sort(self):
+        """test formatted block lines are reused after re-sorting"""
+        inspector = self.create_inspector(block_count=4, hit_counts=True)
+        inspector._ensure_block_list()
+
+        line = inspector._get_block_line(0)
+        inspector._toggle_block_sort()
+
+        assert inspector._get_block_line(3) is line
+        assert "0x00001000" in line
+
+    def test_block_list_built_on_first_use(self):
+        """test the block list is only built when the blocks view needs it"""
+        inspector = self.create_inspector()
+        assert not inspector._block_rows
+
+        inspector.view_creator.create_blocks_view()
+        assert len(inspector.block_list) == 3
+
+        inspector._refresh_block_list()
+        assert inspector._block_list_stale
+
+    def test_module_list_totals(self):
+        """test per-module block, byte and hit totals"""
+        inspector = self.create_inspector(block_count=5, hit_counts=True)
+
+        by_name = {mod["name"]: mod for mod in inspector.module_list}
+        program = by_name["program@0x400000"]
+
+        assert list(by_name) == sorted(by_name)
+        assert (program["count"], program["size"], program["hits"]) == (3, 48, 9)
+        assert program["percentage"] == 60.0
+        assert program["line"].startswith("program@0x400000 ")
+
+    def test_header_updated_in_place(self):
+        """test the header keeps its widgets and only gains the blocks status line"""
+        inspector = self.create_inspector()
+
+        header = inspector._create_header()
+        assert len(header.contents) == 2
+
+        inspector.current_view = "blocks"
+        assert inspector._create_header() is header
+        assert len(header.contents) == 3
+        assert inspector._header_view_status.text.startswith("3 blocks")
+
+        inspector.current_view = "stats"
+        inspector._create_header()
+        assert len(header.contents) == 2
+
+    def test_search_and_size_filters(self):
+        """test per-block filters keep only matching blocks"""
+        inspector = self.create_inspector(block_count=6, hit_counts=True)
+
+        inspector.search_term = "libc"
+        inspector._refresh_block_list()
+        inspector._ensure_block_list()
+        assert len(inspector.block_list) == 3
+        assert {inspector._get_block_row(i)[1] for i in range(3)} == {"libc.so"}
+
+        inspector.search_term = ""
+        inspector.size_filter = inspector._parse_range_filter(">16")
+        inspector._refresh_block_list()
+        inspector._ensure_block_list()
+        assert len(inspector.block_list) == 0
+
+    def test_modules_view_selection(self):
+        """test the modules view keeps its header fixed and selects by index"""
+        inspector = self.create_inspector()
+
+        lines = [line.decode() for line in inspector.content_area.render(SCREEN).text]
+        assert lines[0].startswith("Module")
+        assert lines[2].startswith("libc.so@0x7fff00000000")
+
+        inspector.module_listbox.keypress(SCREEN, "down")
+        inspector._handle_module_selection()
+
+        assert inspector.current_filter == "program@0x400000"
+        assert inspector.current_view == "blocks"
+
+    def test_header_stats_with_filter(self):
+        """test the header summary counts filtered blocks and hits"""
+        inspector = self.create_inspector(block_count=4, hit_counts=True)
+
+        inspector._apply_filter("libc.so@0x7fff00000000")
+
+        stats = inspector._header_stats.text
+        assert "Blocks: 2/4 (50.0%)" in stats
+        assert "Hits: 6/10" in stats
+
+    def test_block_orders_cached_until_rebuild(self):
+        """test sort toggles reuse orderings until the block list is rebuilt"""
+        inspector = self.create_inspector(block_count=6, hit_counts=True)
+        inspector._ensure_block_list()
+
+        inspector._toggle_block_sort()
+        by_hits = inspector.block_list
+        inspector._toggle_block_sort()
+        inspector._toggle_block_sort()
+        assert inspector.block_list is by_hits
+
+        inspector._refresh_block_list()
+        inspector._ensure_block_list()
+        assert inspector.block_list is not by_hits
+        assert inspector.block_list == by_hits
+
+    def test_hit_distribution_stats(self):
+        """test hit counts are bucketed into the distribution ranges"""
+        b = builder()
+        b.add_module("/bin/program", 0x400000, 0x450000)
+        for i, hits in enumerate([1, 1, 2, 10, 11, 1000, 1001]):
+            b.add_coverage(0, 0x1000 + i * 16, 16, hit_count=hits)
+        inspector = self.attach_screen(
+            CoverageInspector(CoverageSet(b.build()), "test.drcov")
+        )
+
+        content = inspector.view_creator._create_hit_distribution_stats()
+        lines = [widget.text for widget in content if isinstance(widget, urwid.Text)]
+
+        assert lines == [
+            "  1 hit: 2 blocks (28.6%)",
+            "  2-10 hits: 2 blocks (28.6%)",
+            "  11-100 hits: 1 blocks (14.3%)",
+            "  101-1000 hits: 1 blocks (14.3%)",
+            "  1000+ hits: 1 blocks (14.3%)",
+        ]
+
+    def test_unchanged_header_text_not_reset(self):
+        """test header and footer updates skip widgets whose text is unchanged"""
+        inspector = self.create_inspector()
+
+        calls = []
+        inspector._header_title.set_text = calls.append
+        inspector._footer_text.set_text = calls.append
+        inspector._update_view()
+        inspector._update_header_footer()
+
+        assert calls == []
+
+    def test_filter_runs_off_ui_thread(self):
+        """test module filtering shows a placeholder and drops stale results"""
+        inspector = self.create_inspector(block_count=4, hit_counts=True)
+
+        with self.filter_pipe(inspector) as read_fd:
+            inspector._apply_filter("libc.so@0x7fff00000000")
+            placeholder = inspector.content_area.original_widget
+            assert os.read(read_fd, 1) == b"."  # worker finished
+            assert inspector.filtered_coverage is inspector.coverage
+
+            inspector._on_filter_done(b".")
+            assert len(inspector.filtered_coverage) == 2
+            assert inspector.content_area.original_widget is not placeholder
+            # block columns were built by the worker, not on the ui thread
+            assert not inspector._block_list_stale
+            assert len(inspector._block_rows) == 2
+
+            inspector._apply_filter("program")
+            os.read(read_fd, 1)
+            inspector._reset_all_filters()
+            inspector._on_filter_done(b".")
+            assert inspector.filtered_coverage is inspector.coverage
+
+    def test_failed_filter_reported(self):
+        """test a worker error replaces the placeholder with a message"""
+        inspector = self.create_inspector()
+
+        def broken_filter(filter_text):
+            raise ValueError("bad module table")
+
+        inspector._filter_coverage = broken_filter
+        with self.filter_pipe(inspector) as read_fd:
+            inspector._apply_filter("libc")
+            assert os.read(read_fd, 1) == b"."  # notified despite the error
+            inspector._on_filter_done(b".")
+
+            canvas = inspector.content_area.render(SCREEN)
+            text = b"".join(canvas.text).decode()
+            assert "Filtering failed: bad module table" in text
+            assert inspector.filtered_coverage is inspector.coverage
+
+    def test_prebuilt_columns_dropped_when_filters_change(self):
+        """test worker-built block columns are not used for changed filters"""
+        inspector = self.create_inspector(block_count=4)
+
+        filtered = inspector.coverage.filter_by_module("libc")
+        filter_key = inspector._get_block_filter_key()
+        columns = inspector._build_block_columns(filtered)
+        inspector.size_filter = inspector._parse_range_filter(">16")
+        inspector._install_filter(filtered, (filter_key, *columns, {}))
+
+        assert inspector._block_list_stale
+        inspector._ensure_block_list()
+        assert len(inspector.block_list) == 0
+
+    def test_superseded_filter_finishing_last_is_dropped(self):
+        """test a newer filter wins when an older one finishes after it"""
+        inspector = self.create_inspector(block_count=5)
+
+        release = threading.Event()
+        filter_coverage = inspector._filter_coverage
+
+        def slow_filter(filter_text):
+            if filter_text == "program":
+                release.wait(5)
+            return filter_coverage(filter_text)
+
+        inspector._filter_coverage = slow_filter
+        with self.filter_pipe(inspector) as read_fd:
+            inspector._apply_filter("program")
+            inspector._apply_filter("libc")
+            placeholder = inspector.content_area.original_widget
+            assert os.read(read_fd, 1) == b"."  # libc finished first
+            release.set()
+            assert os.read(read_fd, 1) == b"."  # then the older program filter
+
+            inspector._on_filter_done(b".")
+            inspector._on_filter_done(b".")
+
+            assert len(inspector.filtered_coverage) == 2  # libc blocks only
+            assert inspector.content_area.original_widget is not placeholder
+            assert inspector._filter_results == {}
+
+    def test_vi_navigation_moves_focus(self):
+        """test j/k/J/K move the list focus directly and stay in bounds"""
+        inspector = self.create_inspector(block_count=50)
+
+        inspector._handle_input("j")
+        assert inspector.module_listbox.focus_position == 1
+        inspector._handle_input("j")
+        assert inspector.module_listbox.focus_position == 1
+
+        inspector.current_view = "blocks"
+        inspector._update_view()
+        view = inspector.content_area.original_widget
+        page = inspector._get_page_rows()
+
+        inspector._handle_input("J")
+        inspector._handle_input("j")
+        assert view.focus_index == page + 1
+        inspector._handle_input("K")
+        inspector._handle_input("K")
+        assert view.focus_index == 0
+
+    def test_dialogs_built_once(self):
+        """test the filter and help dialogs reuse their widgets between shows"""
+        inspector = self.create_inspector()
+        inspector.main_loop = types.SimpleNamespace(widget=inspector.main_widget)
+
+        inspector._handle_input("h")
+        help_overlay = inspector.main_loop.widget
+        inspector._handle_input("h")
+        assert inspector.main_loop.widget is help_overlay
+
+        inspector._handle_input("f")
+        dialog = inspector._filter_dialog
+        edit = dialog.edit_widget
+        edit.set_edit_text("libc")
+        dialog._on_cancel()
+
+        inspector.current_filter = "program"
+        inspector._handle_input("f")
+        assert dialog.edit_widget is edit
+        assert edit.get_edit_text() == "program"
+        assert edit.edit_pos == len("program")
+
+    def test_stats_aggregates_reused_until_filter(self):
+        """test stats sections are only recomputed when the coverage changes"""
+        inspector = self.create_inspector(block_count=4, hit_counts=True)
+        creator = inspector.view_creator
+
+        sections = creator._get_coverage_stats()
+        inspector.search_term = "libc"
+        inspector._refresh_module_list()
+        inspector._refresh_block_list()
+        creator.create_stats_view()
+        assert creator._get_coverage_stats() is sections
+
+        inspector._apply_filter("libc.so")
+        assert creator._get_coverage_stats() is not sections
+        content = creator._get_coverage_stats()
+        texts = [w.text for w in content if isinstance(w, urwid.Text)]
+        assert "  Total basic blocks: 2" in texts
+
+    def test_page_rows_use_cached_screen_size(self):
+        """test page moves size pages from the main loop's cached screen size"""
+        inspector = self.create_inspector()
+        inspector.main_loop = types.SimpleNamespace(screen_size=(100, 30), screen=None)
+
+        # frame header (2 lines) and footer, plus the list's column header
+        assert inspector._get_page_rows() == 30 - 3 - inspector.HEADER_ROWS